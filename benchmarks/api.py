@@ -0,0 +1,286 @@
+import argparse
+import asyncio
+import collections
+import contextlib
+import io
+import itertools
+import json
+import os
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+from starlette.routing import Match
+
+# Ağ erişimi olmadan uç nokta ölçümleri. fastf1 yerine fake_fastf1 (deterministik,
+# gerçek boyutlarda takvim/sonuç/tur/hava/yarış kontrolü) yüklenir, formula1.com
+# yerine yerel bir HTTP sunucusu takvim sayfası döner. main.app süreç içinde bir
+# ASGI istemcisiyle (httpx.ASGITransport) çağrılır. Her uç nokta için soğuk istek,
+# gecikme yüzdelikleri, verim, tracemalloc tahsisleri ve en yüksek RSS raporlanır;
+# ardından eşzamanlı yük senaryosu çalışır. Kariyer sorguları için STORE_SEASONS
+# önce ingest.py ile geçici bir Parquet deposuna yazılır.
+#
+#   python benchmarks/api.py                 # önbellekler açık (üretim ayarı)
+#   python benchmarks/api.py --no-cache      # yanıt/payload önbellekleri kapalı
+#   python benchmarks/api.py --json sonuc.json --filter laps
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+
+SEASON = 2023
+ROUND = 1
+STORE_SEASONS = (SEASON - 2, SEASON - 1, SEASON)
+REQUESTS = 30
+ALLOC_REQUESTS = 3
+CONCURRENCY = 32
+CONCURRENT_REQUESTS = 640
+
+ARROW = {"accept": "application/vnd.apache.arrow.stream"}
+NDJSON = {"accept": "application/x-ndjson"}
+
+# (rota şablonu, URL, başlıklar)
+SCENARIOS = [
+    ("/", "/", {}),
+    ("/cache/stats", "/cache/stats", {}),
+    ("/metrics", "/metrics", {}),
+    ("/admin/prefetch", "/admin/prefetch", {}),
+    ("/races/{season}", f"/races/{SEASON}", {}),
+    ("/races/{season}/{round}", f"/races/{SEASON}/{ROUND}", {}),
+    ("/races/{season}/{round}/results", f"/races/{SEASON}/{ROUND}/results", {}),
+    ("/races/{season}/{round}/qualifying", f"/races/{SEASON}/{ROUND}/qualifying", {}),
+    ("/races/{season}/{round}/drivers", f"/races/{SEASON}/{ROUND}/drivers", {}),
+    ("/drivers/{season}", f"/drivers/{SEASON}", {}),
+    ("/drivers/{season}/{driver_id}", f"/drivers/{SEASON}/VER", {}),
+    ("/constructors/{season}", f"/constructors/{SEASON}", {}),
+    ("/races/{season}/{round}/lap-times/{driver}", f"/races/{SEASON}/{ROUND}/lap-times/VER", {}),
+    ("/races/{season}/{round}/laps", f"/races/{SEASON}/{ROUND}/laps", {}),
+    ("/races/{season}/{round}/laps", f"/races/{SEASON}/{ROUND}/laps?drivers=VER,HAM&include=sectors,tyres", {}),
+    ("/races/{season}/{round}/laps", f"/races/{SEASON}/{ROUND}/laps", ARROW),
+    ("/races/{season}/{round}/laps", f"/races/{SEASON}/{ROUND}/laps", NDJSON),
+    ("/races/{season}/{round}/sector-times/{driver}", f"/races/{SEASON}/{ROUND}/sector-times/VER", {}),
+    ("/races/{season}/{round}/tyres/{driver}", f"/races/{SEASON}/{ROUND}/tyres/VER", {}),
+    ("/races/{season}/{round}/weather", f"/races/{SEASON}/{ROUND}/weather", {}),
+    ("/races/{season}/{round}/pace", f"/races/{SEASON}/{ROUND}/pace", {}),
+    ("/races/{season}/{round}/events", f"/races/{SEASON}/{ROUND}/events", {}),
+    ("/races/{season}/{round}/replay", f"/races/{SEASON}/{ROUND}/replay?speed=0", {}),
+    ("/races/{season}/{round}/telemetry/{driver}/{lap}", f"/races/{SEASON}/{ROUND}/telemetry/VER/fastest?points=500", {}),
+    ("/races/{season}/{round}/telemetry", f"/races/{SEASON}/{ROUND}/telemetry?drivers=VER,HAM,LEC&points=500", {}),
+    ("/standings/drivers/{season}", f"/standings/drivers/{SEASON}", {}),
+    ("/standings/constructors/{season}", f"/standings/constructors/{SEASON}", {}),
+    ("/standings/drivers/{season}/progression", f"/standings/drivers/{SEASON}/progression", {}),
+    ("/standings/constructors/{season}/progression", f"/standings/constructors/{SEASON}/progression", {}),
+    ("/track-map/{season}/{round}", f"/track-map/{SEASON}/{ROUND}?format=png", {}),
+    ("/track-map/{season}/{round}", f"/track-map/{SEASON}/{ROUND}?format=svg", {}),
+    ("/track-map/{season}/{round}", f"/track-map/{SEASON}/{ROUND}?format=json", {}),
+    ("/sprints/{season}", f"/sprints/{SEASON}", {}),
+    ("/career/drivers/{driver}", "/career/drivers/VER", {}),
+    ("/career/drivers/{driver}", f"/career/drivers/HAM?seasons={SEASON - 1}-{SEASON}", {}),
+    ("/career/teams/{team}", "/career/teams/ferrari", {}),
+    ("/career/drivers/{driver}/results", "/career/drivers/LEC/results?position_max=3", {}),
+    ("/sprints/2024", "/sprints/2024", {}),
+    ("/scrape-race-schedule/{year}", f"/scrape-race-schedule/{SEASON}", {}),
+]
+# Ölçülmeyen rotalar ve nedeni
+SKIPPED = {
+    "/scrape-sprints/{season}": "Chrome/Selenium gerektirir",
+    "/races/{season}/{round}/replay/ws": "WebSocket; ASGI istemcisi yalnızca HTTP destekler",
+}
+# Eşzamanlı senaryoda karışık olarak çağrılan uç noktalar
+CONCURRENT_URLS = [
+    f"/races/{SEASON}/{r}/results" for r in range(1, 6)
+] + [
+    f"/races/{SEASON}/{r}/laps" for r in range(1, 4)
+] + [
+    f"/races/{SEASON}/{ROUND}/weather",
+    f"/standings/drivers/{SEASON}",
+    f"/drivers/{SEASON}",
+]
+
+
+class ScheduleHandler(BaseHTTPRequestHandler):
+    # formula1.com takvim sayfasının _parse_race_schedule için yeterli kopyası
+    def do_GET(self):
+        events = "".join(
+            f'<div class="event-item-wrapper"><div class="event-title"><span class="event-title-text">'
+            f'Grand Prix {i}</span></div><div class="event-date"><span class="date">{i:02d} Mar</span></div>'
+            f'<div class="event-session-list"><div class="session-item--race"><span class="session-time">'
+            f'15:00</span></div></div></div>'
+            for i in range(1, 25)
+        )
+        body = f"<html><body>{events}</body></html>".encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def prepare(no_cache):
+    tmp = tempfile.mkdtemp(prefix="f1-bench-")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ScheduleHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["F1_WEB_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.environ["PAYLOAD_CACHE_DIR"] = os.path.join(tmp, "payloads")
+    os.environ["TRACK_MAP_CACHE_DIR"] = os.path.join(tmp, "track_maps")
+    os.environ["FASTF1_CACHE_DIR"] = os.path.join(tmp, "fastf1")
+    os.environ["DATA_STORE_DIR"] = os.path.join(tmp, "store")
+    if no_cache:
+        os.environ["RESPONSE_CACHE_MAX_BYTES"] = "0"
+        os.environ["PAYLOAD_CACHE_ENABLED"] = "0"
+    os.chdir(ROOT)
+    sys.path[:0] = [BENCH_DIR, ROOT]
+    import fake_fastf1
+    sys.modules["fastf1"] = fake_fastf1
+    import main
+    import ingest
+    with contextlib.redirect_stdout(io.StringIO()):
+        ingest.ingest(STORE_SEASONS)
+    main.session_cache.clear()
+    return main
+
+
+def matched_route(app, url):
+    # İsteğe gerçekte hangi rotanın cevap verdiği yönlendiricinin kayıt sırasıyla bulunur
+    scope = {"type": "http", "path": url.split("?", 1)[0], "method": "GET"}
+    for route in app.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return None
+
+
+def misrouted_scenarios(app):
+    return [
+        (url, template, route) for template, url, _ in SCENARIOS
+        if (route := matched_route(app, url)) != template
+    ]
+
+
+def uncovered_routes(app):
+    covered = {matched_route(app, url) for _, url, _ in SCENARIOS}
+    return [
+        route.path for route in app.routes
+        if "GET" in getattr(route, "methods", ()) and route.path not in covered and route.path not in SKIPPED
+        and not route.path.startswith(("/docs", "/redoc", "/openapi"))
+    ]
+
+
+def rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 1024 / (1024 if sys.platform == "darwin" else 1)
+
+
+def percentiles(latencies):
+    p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+    return {"p50_ms": p50, "p95_ms": p95, "p99_ms": p99}
+
+
+async def measure(client, url, headers, requests):
+    start = time.perf_counter()
+    response = await client.get(url, headers=headers)
+    cold = time.perf_counter() - start
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(requests):
+        t = time.perf_counter()
+        await client.get(url, headers=headers)
+        latencies.append(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(ALLOC_REQUESTS):
+        await client.get(url, headers=headers)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "status": response.status_code,
+        "bytes": len(response.content),
+        "cold_ms": cold * 1000,
+        **percentiles(latencies),
+        "req_per_s": requests / elapsed,
+        "alloc_peak_kb": (peak - before) / 1024,
+        "alloc_retained_kb": (current - before) / 1024 / ALLOC_REQUESTS,
+        "rss_mb": rss_mb(),
+    }
+
+
+async def concurrent(client, concurrency, total):
+    jobs = itertools.islice(itertools.cycle(CONCURRENT_URLS), total)
+    latencies = []
+    statuses = collections.Counter()
+
+    async def worker():
+        for url in jobs:
+            t = time.perf_counter()
+            response = await client.get(url)
+            latencies.append(time.perf_counter() - t)
+            statuses[response.status_code] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {
+        "concurrency": concurrency,
+        "requests": total,
+        **percentiles(latencies),
+        "req_per_s": total / elapsed,
+        "statuses": dict(statuses),
+        "rss_mb": rss_mb(),
+    }
+
+
+async def run(main, args):
+    import httpx
+    transport = httpx.ASGITransport(app=main.app)
+    results = []
+    async with main.app.router.lifespan_context(main.app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for template, url, headers in SCENARIOS:
+                if args.filter and args.filter not in url:
+                    continue
+                name = url + (f" [{headers['accept']}]" if "accept" in headers else "")
+                with contextlib.redirect_stdout(io.StringIO()):
+                    result = await measure(client, url, headers, args.requests)
+                results.append({"route": template, "name": name, **result})
+                print(f"{name[:58]:58s} {result['status']:3d} soğuk {result['cold_ms']:8.1f} ms  "
+                      f"p50 {result['p50_ms']:7.2f}  p95 {result['p95_ms']:7.2f}  p99 {result['p99_ms']:7.2f} ms  "
+                      f"{result['req_per_s']:7.0f} istek/s  tahsis {result['alloc_peak_kb']:8.0f} KB  "
+                      f"RSS {result['rss_mb']:6.0f} MB")
+            load = None
+            if not args.filter:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    load = await concurrent(client, args.concurrency, args.concurrent_requests)
+                print(f"\neşzamanlı {load['concurrency']} istemci, {load['requests']} istek: "
+                      f"p50 {load['p50_ms']:.1f}  p95 {load['p95_ms']:.1f}  p99 {load['p99_ms']:.1f} ms  "
+                      f"{load['req_per_s']:.0f} istek/s  durum {load['statuses']}  RSS {load['rss_mb']:.0f} MB")
+    return {"endpoints": results, "concurrent": load}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ağ gerektirmeyen uç nokta ölçümleri")
+    parser.add_argument("--requests", type=int, default=REQUESTS)
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY)
+    parser.add_argument("--concurrent-requests", type=int, default=CONCURRENT_REQUESTS)
+    parser.add_argument("--no-cache", action="store_true", help="yanıt ve payload önbelleklerini kapatır")
+    parser.add_argument("--filter", help="yalnızca URL'si bu metni içeren senaryolar")
+    parser.add_argument("--json", help="sonuçların yazılacağı dosya")
+    args = parser.parse_args()
+
+    main = prepare(args.no_cache)
+    for url, template, route in misrouted_scenarios(main.app):
+        print(f"uyarı: {url} senaryosu {template} yerine {route} rotasına düşüyor")
+    for path in uncovered_routes(main.app):
+        print(f"uyarı: senaryosu olmayan rota {path}")
+    for path, reason in SKIPPED.items():
+        print(f"atlandı: {path} ({reason})")
+    report = asyncio.run(run(main, args))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
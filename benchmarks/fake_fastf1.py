@@ -0,0 +1,353 @@
+import types
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# fastf1 yerine geçen deterministik, ağ gerektirmeyen sahte arka uç.
+# Boyutlar gerçek bir yarış hafta sonuna yakın tutulur.
+
+N_ROUNDS = 24
+SPRINT_ROUNDS = {4, 6, 11, 18, 21, 23}
+N_LAPS = 57
+LAP_SAMPLES = 800
+WEATHER_INTERVAL_S = 60
+
+TEAMS = [
+    ("Red Bull Racing", "3671C6"), ("Ferrari", "E8002D"), ("Mercedes", "27F4D2"),
+    ("McLaren", "FF8000"), ("Aston Martin", "229971"), ("Alpine", "0093CC"),
+    ("Williams", "64C4FF"), ("RB", "6692FF"), ("Kick Sauber", "52E252"), ("Haas F1 Team", "B6BABD"),
+]
+DRIVERS = [
+    ("1", "Max", "Verstappen", "VER"), ("11", "Sergio", "Perez", "PER"),
+    ("16", "Charles", "Leclerc", "LEC"), ("55", "Carlos", "Sainz", "SAI"),
+    ("44", "Lewis", "Hamilton", "HAM"), ("63", "George", "Russell", "RUS"),
+    ("4", "Lando", "Norris", "NOR"), ("81", "Oscar", "Piastri", "PIA"),
+    ("14", "Fernando", "Alonso", "ALO"), ("18", "Lance", "Stroll", "STR"),
+    ("10", "Pierre", "Gasly", "GAS"), ("31", "Esteban", "Ocon", "OCO"),
+    ("23", "Alexander", "Albon", "ALB"), ("2", "Logan", "Sargeant", "SAR"),
+    ("22", "Yuki", "Tsunoda", "TSU"), ("3", "Daniel", "Ricciardo", "RIC"),
+    ("77", "Valtteri", "Bottas", "BOT"), ("24", "Guanyu", "Zhou", "ZHO"),
+    ("27", "Nico", "Hulkenberg", "HUL"), ("20", "Kevin", "Magnussen", "MAG"),
+]
+SESSION_NAMES = {"R": "Race", "Q": "Qualifying", "S": "Sprint", "Sprint": "Sprint"}
+COMPOUNDS = ["SOFT", "MEDIUM", "HARD"]
+
+
+class DataNotLoadedError(Exception):
+    pass
+
+
+def sprint_format(season):
+    # fastf1'in sezona göre verdiği EventFormat değerleri
+    if season >= 2024:
+        return "sprint_qualifying"
+    if season == 2023:
+        return "sprint_shootout"
+    return "sprint"
+
+
+def _rng(*key):
+    return np.random.default_rng(zlib.crc32(repr(key).encode()))
+
+
+def get_event_schedule(season, include_testing=True, **kwargs):
+    rows = [{
+        "RoundNumber": 0, "Country": "Bahrain", "Location": "Sakhir",
+        "EventName": "Pre-Season Testing", "EventDate": pd.Timestamp(f"{season}-02-22"),
+        "EventFormat": "testing", "Session5Date": pd.NaT,
+    }]
+    start = pd.Timestamp(f"{season}-03-02")
+    for rnd in range(1, N_ROUNDS + 1):
+        date = start + pd.Timedelta(days=14 * (rnd - 1))
+        rows.append({
+            "RoundNumber": rnd, "Country": f"Country {rnd}", "Location": f"City {rnd}",
+            "EventName": f"Grand Prix {rnd}", "EventDate": date,
+            "EventFormat": sprint_format(season) if rnd in SPRINT_ROUNDS else "conventional",
+            "Session5Date": date,
+        })
+    return pd.DataFrame(rows)
+
+
+class Laps(pd.DataFrame):
+    _metadata = ["session"]
+
+    @property
+    def _constructor(self):
+        return Laps
+
+    @property
+    def _constructor_sliced(self):
+        return Lap
+
+    def pick_driver(self, identifier):
+        return self.pick_drivers(identifier)
+
+    def pick_drivers(self, identifiers):
+        if not isinstance(identifiers, (list, tuple, set)):
+            identifiers = [identifiers]
+        identifiers = [str(i) for i in identifiers]
+        return self[self["Driver"].isin(identifiers) | self["DriverNumber"].isin(identifiers)]
+
+    def pick_fastest(self):
+        laps = self[self["LapTime"].notna()]
+        if laps.empty:
+            return None
+        return laps.loc[laps["LapTime"].idxmin()]
+
+
+class Lap(pd.Series):
+    _metadata = ["session"]
+
+    @property
+    def _constructor(self):
+        return Lap
+
+    @property
+    def _constructor_expanddim(self):
+        return Laps
+
+    def _samples(self):
+        # fastf1'de olduğu gibi tur telemetrisi yalnızca telemetry=True ile yüklenince okunabilir
+        session = _SESSIONS_BY_ID[self["SessionId"]]
+        session._require("telemetry", None)
+        return session._lap_samples(self["DriverNumber"], int(self["LapNumber"]))
+
+    def get_pos_data(self):
+        return self._samples()[["Date", "SessionTime", "Time", "X", "Y", "Z"]]
+
+    def get_car_data(self):
+        return self._samples()[["Date", "SessionTime", "Time", "RPM", "Speed", "nGear", "Throttle", "Brake", "DRS"]]
+
+    def get_telemetry(self):
+        return self._samples()
+
+
+class CircuitInfo:
+    def __init__(self, rotation):
+        self.rotation = rotation
+        self.corners = pd.DataFrame({"X": [], "Y": [], "Number": [], "Letter": [], "Angle": [], "Distance": []})
+
+
+_SESSIONS_BY_ID = {}
+
+
+class Session:
+    def __init__(self, season, round, code):
+        if round < 1 or round > N_ROUNDS:
+            raise ValueError(f"Invalid round {round}")
+        if code in ("S", "Sprint") and round not in SPRINT_ROUNDS:
+            raise ValueError(f"Session type '{code}' does not exist for this event")
+        self.season = season
+        self.round = round
+        self.code = code
+        self.name = SESSION_NAMES.get(code, code)
+        schedule = get_event_schedule(season)
+        self.event = schedule[schedule["RoundNumber"] == round].iloc[0]
+        self.date = self.event["EventDate"]
+        self.session_info = {"Meeting": {"Circuit": {"Key": 100 + round, "ShortName": f"City {round}"}}}
+        self.f1_api_support = True
+        self._loaded = set()
+        self._id = id(self)
+        _SESSIONS_BY_ID[self._id] = self
+
+    def load(self, *, laps=True, telemetry=True, weather=True, messages=True, livedata=None):
+        self._results = self._make_results()
+        if laps:
+            self._laps = self._make_laps()
+            self._loaded.add("laps")
+        if telemetry:
+            self._car_data = {d[0]: None for d in DRIVERS}
+            self._pos_data = {d[0]: None for d in DRIVERS}
+            # fastf1 t0_date'i yalnızca telemetri yüklenirken hesaplar
+            self._t0_date = pd.Timestamp(self.date) + pd.Timedelta(hours=12)
+            self._loaded.add("telemetry")
+        if weather:
+            self._weather = self._make_weather()
+            self._loaded.add("weather")
+        if messages:
+            self._messages = self._make_messages()
+            self._loaded.add("messages")
+
+    def _require(self, part, value):
+        if part not in self._loaded:
+            raise DataNotLoadedError(f"The data you are trying to access has not been loaded yet ({part}).")
+        return value
+
+    @property
+    def results(self):
+        if not hasattr(self, "_results"):
+            raise DataNotLoadedError("results not loaded")
+        return self._results
+
+    @property
+    def laps(self):
+        return self._require("laps", getattr(self, "_laps", None))
+
+    @property
+    def weather_data(self):
+        return self._require("weather", getattr(self, "_weather", None))
+
+    @property
+    def race_control_messages(self):
+        return self._require("messages", getattr(self, "_messages", None))
+
+    @property
+    def t0_date(self):
+        return self._require("telemetry", getattr(self, "_t0_date", None))
+
+    @property
+    def car_data(self):
+        return self._require("telemetry", self._car_data)
+
+    @property
+    def pos_data(self):
+        return self._require("telemetry", self._pos_data)
+
+    @property
+    def drivers(self):
+        return [d[0] for d in DRIVERS]
+
+    def get_driver(self, identifier):
+        results = self.results
+        row = results[(results["Abbreviation"] == identifier) | (results["DriverNumber"] == str(identifier))]
+        return row.iloc[0]
+
+    def get_circuit_info(self):
+        return CircuitInfo(rotation=float(self.round * 7 % 360))
+
+    def _order(self):
+        return _rng(self.season, self.round, self.code).permutation(len(DRIVERS))
+
+    def _make_results(self):
+        order = self._order()
+        rows = []
+        for pos, idx in enumerate(order, start=1):
+            number, first, last, abbr = DRIVERS[idx]
+            team, colour = TEAMS[idx // 2]
+            finished = pos <= 18
+            rows.append({
+                "DriverNumber": number, "BroadcastName": f"{first[0]} {last.upper()}",
+                "Abbreviation": abbr, "DriverId": last.lower(), "TeamName": team,
+                "TeamColor": colour, "TeamId": team.lower().replace(" ", "_"),
+                "FirstName": first, "LastName": last, "FullName": f"{first} {last}",
+                "HeadshotUrl": "", "CountryCode": "", "Position": float(pos),
+                "ClassifiedPosition": str(pos) if finished else "R",
+                "GridPosition": float(((pos * 7) % 20) + 1),
+                "Q1": pd.Timedelta(seconds=91 + pos * 0.1),
+                "Q2": pd.Timedelta(seconds=90 + pos * 0.1) if pos <= 15 else pd.NaT,
+                "Q3": pd.Timedelta(seconds=89 + pos * 0.1) if pos <= 10 else pd.NaT,
+                "Time": pd.Timedelta(hours=1, minutes=32, seconds=pos * 3.217) if finished else pd.NaT,
+                "Status": "Finished" if finished else "Retired",
+                "Points": 0.0, "Laps": float(N_LAPS if finished else N_LAPS - 10),
+            })
+        return pd.DataFrame(rows)
+
+    def _make_laps(self):
+        rng = _rng(self.season, self.round, self.code, "laps")
+        n_laps = N_LAPS if self.code == "R" else (19 if self.code in ("S", "Sprint") else 20)
+        order = self._order()
+        frames = []
+        for pos, idx in enumerate(order, start=1):
+            number, first, last, abbr = DRIVERS[idx]
+            team, _ = TEAMS[idx // 2]
+            lap_numbers = np.arange(1, n_laps + 1)
+            pit_laps = {n_laps // 3, 2 * n_laps // 3}
+            stint = np.cumsum([1] + [1 if (n - 1) in pit_laps else 0 for n in lap_numbers[1:]])
+            tyre_life = np.zeros(n_laps)
+            for i in range(n_laps):
+                tyre_life[i] = 1 if i == 0 or stint[i] != stint[i - 1] else tyre_life[i - 1] + 1
+            base = 90.0 + pos * 0.05
+            lap_s = base + tyre_life * 0.04 + rng.normal(0, 0.3, n_laps)
+            lap_s[0] += 5
+            s1 = lap_s * 0.31
+            s2 = lap_s * 0.37
+            s3 = lap_s - s1 - s2
+            session_time = 3600 + np.cumsum(lap_s)
+            pit_in = np.array([n in pit_laps for n in lap_numbers])
+            pit_out = np.concatenate([[False], pit_in[:-1]])
+            frames.append(pd.DataFrame({
+                "Time": pd.to_timedelta(session_time, unit="s"),
+                "Driver": abbr, "DriverNumber": number,
+                "LapTime": pd.to_timedelta(lap_s, unit="s"),
+                "LapNumber": lap_numbers.astype(float),
+                "Stint": stint.astype(float),
+                "PitOutTime": pd.to_timedelta(np.where(pit_out, session_time - lap_s, np.nan), unit="s"),
+                "PitInTime": pd.to_timedelta(np.where(pit_in, session_time - 2, np.nan), unit="s"),
+                "Sector1Time": pd.to_timedelta(s1, unit="s"),
+                "Sector2Time": pd.to_timedelta(s2, unit="s"),
+                "Sector3Time": pd.to_timedelta(s3, unit="s"),
+                "SpeedI1": rng.normal(290, 5, n_laps), "SpeedI2": rng.normal(280, 5, n_laps),
+                "SpeedFL": rng.normal(270, 5, n_laps), "SpeedST": rng.normal(310, 5, n_laps),
+                "IsPersonalBest": False,
+                "Compound": [COMPOUNDS[(int(s) - 1) % 3] for s in stint],
+                "TyreLife": tyre_life, "FreshTyre": True, "Team": team,
+                "LapStartTime": pd.to_timedelta(session_time - lap_s, unit="s"),
+                "TrackStatus": "1", "Position": float(pos),
+                "Deleted": False, "IsAccurate": True, "SessionId": self._id,
+            }))
+        laps = Laps(pd.concat(frames, ignore_index=True))
+        # Tur bazında sıralama: o turu en erken tamamlayan birinci
+        laps["Position"] = laps.groupby("LapNumber")["Time"].rank(method="first")
+        return laps
+
+    def _lap_samples(self, driver_number, lap_number):
+        laps = self.laps
+        lap = laps[(laps["DriverNumber"] == driver_number) & (laps["LapNumber"] == lap_number)].iloc[0]
+        rng = _rng(self.season, self.round, driver_number, lap_number)
+        n = LAP_SAMPLES
+        t = np.linspace(0, lap["LapTime"].total_seconds(), n)
+        theta = np.linspace(0, 2 * np.pi, n)
+        speed = 200 + 100 * np.sin(theta * 5) + rng.normal(0, 2, n)
+        start = lap["LapStartTime"]
+        return pd.DataFrame({
+            "Date": self.t0_date + start + pd.to_timedelta(t, unit="s"),
+            "SessionTime": start + pd.to_timedelta(t, unit="s"),
+            "Time": pd.to_timedelta(t, unit="s"),
+            "RPM": 10000 + 1500 * np.sin(theta * 5), "Speed": speed,
+            "nGear": np.clip((speed / 45).astype(int), 1, 8),
+            "Throttle": np.clip(speed / 3, 0, 100), "Brake": speed < 150, "DRS": 0,
+            "X": 5000 * np.cos(theta) + 800 * np.cos(3 * theta),
+            "Y": 3000 * np.sin(theta) + 500 * np.sin(2 * theta), "Z": 0.0,
+            "Distance": np.cumsum(speed / 3.6 * np.gradient(t)),
+        })
+
+    def _make_weather(self):
+        rng = _rng(self.season, self.round, self.code, "weather")
+        n = int(2 * 3600 / WEATHER_INTERVAL_S)
+        return pd.DataFrame({
+            "Time": pd.to_timedelta(np.arange(n) * WEATHER_INTERVAL_S, unit="s"),
+            "AirTemp": 25 + rng.normal(0, 0.5, n), "Humidity": 50 + rng.normal(0, 2, n),
+            "Pressure": 1013 + rng.normal(0, 1, n), "Rainfall": False,
+            "TrackTemp": 40 + rng.normal(0, 1, n), "WindDirection": rng.integers(0, 360, n),
+            "WindSpeed": np.abs(rng.normal(2, 1, n)),
+        })
+
+    def _make_messages(self):
+        n = 90
+        times = pd.Timestamp(self.date) + pd.Timedelta(hours=13) + pd.to_timedelta(np.arange(n) * 75, unit="s")
+        return pd.DataFrame({
+            "Time": times, "UTC": times,
+            "Category": ["Flag" if i % 3 == 0 else "Other" for i in range(n)],
+            "Message": [f"MESSAGE {i}" for i in range(n)],
+            "Status": None, "Flag": ["GREEN" if i % 3 == 0 else None for i in range(n)],
+            "Scope": "Track", "Sector": np.nan, "RacingNumber": None, "Lap": (np.arange(n) // 2 + 1),
+        })
+
+
+def get_session(season, round, identifier=None, **kwargs):
+    return Session(season, round, identifier)
+
+
+class _Cache:
+    @staticmethod
+    def enable_cache(*args, **kwargs):
+        return None
+
+    @staticmethod
+    def offline_mode(*args, **kwargs):
+        return None
+
+
+Cache = _Cache
+core = types.SimpleNamespace(DataNotLoadedError=DataNotLoadedError, Laps=Laps, Lap=Lap, Session=Session)
@@ -0,0 +1,116 @@
+import asyncio
+import hashlib
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# formula1.com kazıyıcılarının ağ gerektirmeyen kontrolü. fixtures/ altındaki
+# kaydedilmiş sayfalar, ETag ve If-None-Match destekleyen yerel bir HTTP
+# sunucusundan verilir; F1_WEB_BASE_URL bu sunucuya çevrilir. Kontrol edilenler:
+# takvim ve sprint sonuç sayfalarının ayrıştırılması, TTL içinde sayfanın yeniden
+# istenmemesi ve TTL dolunca If-None-Match -> 304 ile önceki sonucun kullanılması.
+# Sprint sekmesine tıklama Chrome gerektirdiğinden burada çalıştırılmaz; sprint
+# tablosu kaydedilmiş sayfadan doğrudan ayrıştırılır.
+#
+#   python benchmarks/scrape_offline.py
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+FIXTURES = os.path.join(BENCH_DIR, "fixtures")
+
+PAGES = {
+    "/en/racing/2024.html": "racing_2024.html",
+    "/en/results.html/2024/races.html": "results_2024_sprint.html",
+}
+
+EXPECTED_SCHEDULE = [
+    {"name": "Pre-Season Testing", "date": "21 - 23 Feb", "time": "Saat bilgisi yok"},
+    {"name": "FORMULA 1 GULF AIR BAHRAIN GRAND PRIX 2024", "date": "29 Feb - 02 Mar", "time": "18:00"},
+    {"name": "FORMULA 1 STC SAUDI ARABIAN GRAND PRIX 2024", "date": "07 - 09 Mar", "time": "20:00"},
+    {"name": "FORMULA 1 ROLEX AUSTRALIAN GRAND PRIX 2024", "date": "22 - 24 Mar", "time": "15:00"},
+    {"name": "FORMULA 1 MSC CRUISES JAPANESE GRAND PRIX 2024", "date": "05 - 07 Apr", "time": "14:00"},
+    {"name": "FORMULA 1 LENOVO CHINESE GRAND PRIX 2024", "date": "19 - 21 Apr", "time": "15:00"},
+]
+EXPECTED_SPRINT_HEAD = [
+    {"position": "1", "driver": "Max Verstappen VER", "team": "Red Bull Racing Honda RBPT", "time": "32:04.660", "points": "8"},
+    {"position": "2", "driver": "Lewis Hamilton HAM", "team": "Mercedes", "time": "+13.043s", "points": "7"},
+]
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        name = PAGES.get(self.path)
+        if name is None:
+            self.send_error(404)
+            return
+        with open(os.path.join(FIXTURES, name), "rb") as f:
+            body = f.read()
+        etag = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            FixtureHandler.requests.append((self.path, 304))
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        FixtureHandler.requests.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def prepare():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["F1_WEB_BASE_URL"] = f"http://127.0.0.1:{server.server_port}"
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    import main
+    return main
+
+
+async def check(main):
+    import httpx
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://offline") as client:
+        # İlk istek sayfayı indirir ve ayrıştırır
+        response = await client.get("/scrape-race-schedule/2024")
+        assert response.status_code == 200, response.text
+        assert response.json() == {"year": 2024, "races": EXPECTED_SCHEDULE}, response.json()
+        assert FixtureHandler.requests == [("/en/racing/2024.html", 200)], FixtureHandler.requests
+
+        # TTL içinde sayfa yeniden istenmez
+        response = await client.get("/scrape-race-schedule/2024")
+        assert response.json()["races"] == EXPECTED_SCHEDULE
+        assert len(FixtureHandler.requests) == 1, FixtureHandler.requests
+        assert main.scrape_cache.stats()["hits"] == 1, main.scrape_cache.stats()
+
+        # TTL dolunca koşullu GET yapılır; 304 gelince önceki ayrıştırma sonucu döner
+        main.scrape_cache.ttl = 0
+        response = await client.get("/scrape-race-schedule/2024")
+        assert response.json()["races"] == EXPECTED_SCHEDULE
+        assert FixtureHandler.requests[-1] == ("/en/racing/2024.html", 304), FixtureHandler.requests
+        stats = main.scrape_cache.stats()
+        assert (stats["misses"], stats["revalidated"]) == (1, 1), stats
+
+    with open(os.path.join(FIXTURES, "results_2024_sprint.html"), encoding="utf-8") as f:
+        sprint = main._parse_sprint_table(f.read())
+    assert len(sprint) == 9, sprint
+    assert sprint[:2] == EXPECTED_SPRINT_HEAD, sprint[:2]
+    assert sprint[-1]["position"] == "NC" and sprint[-1]["time"] == "DNF", sprint[-1]
+    return stats, len(sprint)
+
+
+if __name__ == "__main__":
+    main = prepare()
+    stats, sprint_rows = asyncio.run(check(main))
+    print(f"takvim: {len(EXPECTED_SCHEDULE)} etkinlik, istekler {FixtureHandler.requests}, önbellek {stats}")
+    print(f"sprint tablosu: {sprint_rows} satır")
+    print("tamam")
@@ -0,0 +1,90 @@
+import json
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import LAP_TIME_FIELDS, WEATHER_FIELDS, serialize_frame, with_pit_flag
+
+# iterrows() döngüleri ile sütun bazlı serileştiricinin karşılaştırması.
+# Çerçeveler tam bir yarış boyutundadır: 20 sürücü x 57 tur ve ~2 saatlik hava durumu.
+N_DRIVERS = 20
+N_LAPS = 57
+REPEAT = 20
+
+
+def make_laps(seed=0):
+    rng = np.random.default_rng(seed)
+    n = N_DRIVERS * N_LAPS
+    lap_s = 90 + rng.normal(0, 0.5, n)
+    pit_in = rng.random(n) < 0.04
+    return pd.DataFrame({
+        "Time": pd.to_timedelta(3600 + np.cumsum(lap_s), unit="s"),
+        "Driver": np.repeat([f"D{i:02d}" for i in range(N_DRIVERS)], N_LAPS),
+        "LapTime": pd.to_timedelta(np.where(rng.random(n) < 0.01, np.nan, lap_s), unit="s"),
+        "LapNumber": np.tile(np.arange(1, N_LAPS + 1), N_DRIVERS).astype(float),
+        "Stint": np.ones(n),
+        "PitInTime": pd.to_timedelta(np.where(pit_in, 3600.0, np.nan), unit="s"),
+        "Sector1Time": pd.to_timedelta(lap_s * 0.31, unit="s"),
+        "Compound": "MEDIUM",
+        "Position": np.tile(np.arange(1, N_DRIVERS + 1), N_LAPS).astype(float),
+    })
+
+
+def make_weather(seed=0):
+    rng = np.random.default_rng(seed)
+    n = 2 * 60
+    return pd.DataFrame({
+        "Time": pd.to_timedelta(np.arange(n) * 60, unit="s"),
+        "AirTemp": 25 + rng.normal(0, 0.5, n),
+        "Humidity": 50 + rng.normal(0, 2, n),
+        "Pressure": 1013 + rng.normal(0, 1, n),
+        "Rainfall": False,
+        "TrackTemp": 40 + rng.normal(0, 1, n),
+        "WindDirection": rng.integers(0, 360, n),
+        "WindSpeed": np.abs(rng.normal(2, 1, n)),
+    })
+
+
+def laps_iterrows(laps):
+    lap_times = []
+    for _, row in laps.iterrows():
+        lap_times.append({
+            "lap_number": int(row["LapNumber"]),
+            "lap_time": str(row["LapTime"]),
+            "position": int(row["Position"]),
+            "pit": bool(row["PitInLap"])
+        })
+    return lap_times
+
+
+def weather_iterrows(weather):
+    weather_list = []
+    for _, row in weather.iterrows():
+        weather_list.append({
+            "time": str(row["Time"]),
+            "air_temp": float(row["AirTemp"]),
+            "track_temp": float(row["TrackTemp"]),
+            "humidity": float(row["Humidity"]),
+            "rainfall": float(row["Rainfall"]),
+            "wind_speed": float(row["WindSpeed"]),
+            "wind_direction": float(row["WindDirection"])
+        })
+    return weather_list
+
+
+def compare(name, frame, old, fields):
+    assert json.dumps(old(frame)) == json.dumps(serialize_frame(frame, fields)), name
+    t_old = min(timeit.repeat(lambda: old(frame), number=1, repeat=REPEAT))
+    t_new = min(timeit.repeat(lambda: serialize_frame(frame, fields), number=1, repeat=REPEAT))
+    print(f"{name:8s} {len(frame):5d} satır  iterrows {t_old * 1000:8.2f} ms  "
+          f"sütun bazlı {t_new * 1000:7.2f} ms  x{t_old / t_new:5.1f}")
+
+
+if __name__ == "__main__":
+    compare("laps", with_pit_flag(make_laps()), laps_iterrows, LAP_TIME_FIELDS)
+    compare("weather", make_weather(), weather_iterrows, WEATHER_FIELDS)
@@ -0,0 +1,55 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# main.py'nin içe aktarma süresi ve bellek kullanımı: tembel içe aktarmalarla
+# (şimdiki hali) ve Selenium/matplotlib/bs4/requests modül yüklenirken
+# içe aktarılsaydı (eski hali) karşılaştırılır. Her ölçüm yeni bir süreçte yapılır.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+EAGER_IMPORTS = """
+import requests
+from selenium import webdriver
+from selenium.webdriver.common.by import By
+from selenium.webdriver.chrome.options import Options
+import matplotlib.pyplot as plt
+from bs4 import BeautifulSoup
+import lxml.etree
+"""
+
+PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import main
+{extra}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss //= 1024
+print(json.dumps({{"seconds": elapsed, "rss_kb": rss, "modules": len(sys.modules)}}))
+"""
+
+
+def measure(extra):
+    samples = []
+    for _ in range(RUNS):
+        out = subprocess.check_output([sys.executable, "-c", PROBE.format(extra=extra)], cwd=ROOT)
+        samples.append(json.loads(out.decode().strip().splitlines()[-1]))
+    return {
+        "seconds": statistics.median(s["seconds"] for s in samples),
+        "rss_kb": statistics.median(s["rss_kb"] for s in samples),
+        "modules": samples[-1]["modules"],
+    }
+
+
+if __name__ == "__main__":
+    lazy = measure("")
+    eager = measure(EAGER_IMPORTS)
+    for name, result in (("eski (hepsi baştan)", eager), ("tembel", lazy)):
+        print(f"{name:20s} içe aktarma {result['seconds'] * 1000:7.1f} ms  "
+              f"RSS {result['rss_kb'] / 1024:6.1f} MB  modül {result['modules']}")
+    print(f"kazanç: {(eager['seconds'] - lazy['seconds']) * 1000:.1f} ms, "
+          f"{(eager['rss_kb'] - lazy['rss_kb']) / 1024:.1f} MB")
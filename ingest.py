@@ -0,0 +1,188 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import main
+
+# Sezon verisini fastf1 önbelleğinden okuyup DATA_STORE_DIR altında hive tarzı
+# bölümlenmiş Parquet deposuna yazar: {tablo}/season=2024/round=5/part-0.parquet
+# (takvim yalnızca sezona göre bölümlenir). Yalnızca tamamlanmış turlar alınır ve
+# var olan bölümler --force verilmedikçe atlanır. Süreler saniye cinsinden float
+# tutulur. Yazım bitince _version dosyası güncellenir; API bunu görünce tabloları
+# yeniden okur. Sorgular /career/... uç noktalarından yapılır.
+#
+#   python ingest.py 2023 2024 2025
+#   python ingest.py 2025 --tables results,laps --force
+TABLES = ("schedules", "results", "qualifying", "sprints", "laps")
+
+
+def _seconds(values):
+    if pd.api.types.is_timedelta64_dtype(values):
+        return values.dt.total_seconds()
+    return pd.to_numeric(values, errors="coerce")
+
+
+def _column(frame, name, default=None):
+    if name in frame.columns:
+        return frame[name]
+    return pd.Series([default] * len(frame), index=frame.index, dtype=object)
+
+
+def _points(position, points_table):
+    # Puanlar standings motorundaki kurallarla (F1_POINTS / SPRINT_POINTS) hesaplanır
+    position = pd.to_numeric(position, errors="coerce")
+    points = np.zeros(len(position))
+    scoring = position.between(1, len(points_table)).to_numpy()
+    points[scoring] = np.asarray(points_table)[position[scoring].astype(int).to_numpy() - 1]
+    return points
+
+
+def _finished(status):
+    # "Finished", "+1 Lap" ve yeni fastf1 sürümlerindeki "Lapped" bitirmiş sayılır
+    status = status.fillna("").astype(str)
+    return status.eq("Finished") | status.eq("Lapped") | status.str.startswith("+")
+
+
+def results_frame(results, points_table):
+    return pd.DataFrame({
+        "driver_number": _column(results, "DriverNumber").astype(str),
+        "driver_id": _column(results, "DriverId"),
+        "abbreviation": _column(results, "Abbreviation"),
+        "driver": _column(results, "FullName"),
+        "team": _column(results, "TeamName"),
+        "position": pd.to_numeric(_column(results, "Position"), errors="coerce").astype("Int64"),
+        "grid": pd.to_numeric(_column(results, "GridPosition"), errors="coerce").astype("Int64"),
+        "status": _column(results, "Status"),
+        "finished": _finished(_column(results, "Status")),
+        "time": _seconds(_column(results, "Time")),
+        "points": _points(_column(results, "Position"), points_table),
+    })
+
+
+def qualifying_frame(results):
+    return pd.DataFrame({
+        "driver_number": _column(results, "DriverNumber").astype(str),
+        "driver_id": _column(results, "DriverId"),
+        "abbreviation": _column(results, "Abbreviation"),
+        "driver": _column(results, "FullName"),
+        "team": _column(results, "TeamName"),
+        "position": pd.to_numeric(_column(results, "Position"), errors="coerce").astype("Int64"),
+        "q1": _seconds(_column(results, "Q1")),
+        "q2": _seconds(_column(results, "Q2")),
+        "q3": _seconds(_column(results, "Q3")),
+    })
+
+
+def laps_frame(laps):
+    return pd.DataFrame({
+        "driver_number": _column(laps, "DriverNumber").astype(str),
+        "abbreviation": _column(laps, "Driver"),
+        "team": _column(laps, "Team"),
+        "lap_number": pd.to_numeric(_column(laps, "LapNumber"), errors="coerce").astype("Int64"),
+        "lap_time": _seconds(_column(laps, "LapTime")),
+        "position": pd.to_numeric(_column(laps, "Position"), errors="coerce").astype("Int64"),
+        "stint": pd.to_numeric(_column(laps, "Stint"), errors="coerce").astype("Int64"),
+        "compound": _column(laps, "Compound"),
+        "tyre_life": pd.to_numeric(_column(laps, "TyreLife"), errors="coerce"),
+        "pit_in": _column(laps, "PitInTime").notna(),
+        "pit_out": _column(laps, "PitOutTime").notna(),
+    })
+
+
+def schedule_frame(schedule):
+    return pd.DataFrame({
+        "round": [e["round"] for e in schedule.events],
+        "name": [e["name"] for e in schedule.events],
+        "format": [e["format"] for e in schedule.events],
+        "date": [e["date"] for e in schedule.events],
+    })
+
+
+def round_frames(season, event, tables):
+    round_number = event["round"]
+    frames = {}
+    if "results" in tables or "laps" in tables:
+        profile = "laps" if "laps" in tables else "results"
+        session = main.load_session(season, round_number, "R", profile)
+        if "results" in tables and session.results is not None:
+            frames["results"] = results_frame(session.results, main.F1_POINTS)
+        if "laps" in tables and session.laps is not None and not session.laps.empty:
+            frames["laps"] = laps_frame(session.laps)
+    if "qualifying" in tables:
+        results = main.load_session(season, round_number, "Q").results
+        if results is not None:
+            frames["qualifying"] = qualifying_frame(results)
+    if "sprints" in tables and main.has_sprint(event):
+        results = main.load_session(season, round_number, "S").results
+        if results is not None:
+            frames["sprints"] = results_frame(results, main.SPRINT_POINTS)
+    return frames
+
+
+def write_partition(directory, table, frame, season, round_number=None):
+    path = os.path.join(directory, table, f"season={season}")
+    if round_number is not None:
+        path = os.path.join(path, f"round={round_number}")
+    os.makedirs(path, exist_ok=True)
+    target = os.path.join(path, "part-0.parquet")
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    pq.write_table(pa.Table.from_pandas(frame, preserve_index=False), tmp_path)
+    os.replace(tmp_path, target)
+
+
+def partition_exists(directory, table, season, round_number):
+    return os.path.exists(os.path.join(directory, table, f"season={season}", f"round={round_number}", "part-0.parquet"))
+
+
+def ingest(seasons, tables=TABLES, directory=None, force=False, log=print):
+    directory = directory or main.DATA_STORE_DIR
+    written = 0
+    for season in seasons:
+        schedule = main.schedule_service.get(season)
+        if "schedules" in tables:
+            write_partition(directory, "schedules", schedule_frame(schedule), season)
+            written += 1
+        completed = set(schedule.completed_rounds())
+        weekends = [e for e in schedule.weekends() if e["round"] in completed]
+        round_tables = [t for t in tables if t != "schedules"]
+
+        def load(event):
+            missing = [
+                t for t in round_tables
+                if force or not partition_exists(directory, t, season, event["round"])
+            ]
+            return round_frames(season, event, missing) if missing else {}
+
+        for event, (frames, error) in zip(weekends, main.fan_out(load, weekends)):
+            if error is not None:
+                log(f"{season} tur {event['round']}: {error}")
+                continue
+            for table, frame in frames.items():
+                write_partition(directory, table, frame, season, event["round"])
+                written += 1
+        log(f"{season}: {len(weekends)} tur işlendi")
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "_version"), "w", encoding="utf-8") as f:
+        f.write(str(time.time()))
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fastf1 verisini Parquet deposuna yazar")
+    parser.add_argument("seasons", type=int, nargs="+")
+    parser.add_argument("--tables", default=",".join(TABLES), help="virgülle ayrılmış tablo adları")
+    parser.add_argument("--dir", default=None, help="depo dizini (varsayılan DATA_STORE_DIR)")
+    parser.add_argument("--force", action="store_true", help="var olan bölümleri yeniden yazar")
+    args = parser.parse_args()
+    tables = [t.strip() for t in args.tables.split(",") if t.strip()]
+    unknown = [t for t in tables if t not in TABLES]
+    if unknown:
+        sys.exit(f"Geçersiz tablo: {', '.join(unknown)}")
+    count = ingest(args.seasons, tables, args.dir, args.force)
+    print(f"{count} bölüm yazıldı")
@@ -1,19 +1,48 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Header, WebSocket, WebSocketDisconnect
 import fastf1
 import json
-from fastapi.responses import JSONResponse, Response
-import requests
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
+import asyncio
+import contextvars
+import functools
+import importlib
+import threading
+import bisect
+import weakref
+import re
+import mmap
+import gzip
+import hashlib
+import logging
+from contextlib import asynccontextmanager, contextmanager
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+import msgpack
+import numpy as np
+import pandas as pd
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 import time
 from fastapi.staticfiles import StaticFiles
 import os
-import matplotlib.pyplot as plt
 import io
-from bs4 import BeautifulSoup
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
-app = FastAPI()
+# Selenium, matplotlib, BeautifulSoup/lxml, requests ve pyarrow yalnızca onları
+# kullanan uç noktalarda ilk ihtiyaç anında içe aktarılır.
+@asynccontextmanager
+async def lifespan(app):
+    driver_registry.load_all()
+    start_warmup()
+    if PREFETCH_ENABLED:
+        prefetch_scheduler.start(poll=True)
+    yield
+    prefetch_scheduler.stop()
+    browser_pool.close()
+
+app = FastAPI(lifespan=lifespan)
+logger = logging.getLogger(__name__)
 
 F1_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
 SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
@@ -28,61 +57,1242 @@ SPRINT_ROUNDS_2024 = {
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
+# Ölçümler: sıcak yoldaki aşamalar (get_session, load, serialize, render, scrape...)
+# span() ile zamanlanır ve Prometheus histogramlarına yazılır; /metrics bunları,
+# istek sürelerini ve önbellek/havuz sayaçlarını Prometheus metin biçiminde sunar.
+# SERVER_TIMING_ENABLED=1 iken her yanıta aşama dökümü Server-Timing başlığıyla eklenir.
+METRIC_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SERVER_TIMING_ENABLED = os.environ.get("SERVER_TIMING_ENABLED", "0") == "1"
+request_spans = contextvars.ContextVar("request_spans", default=None)
+
+def _metric_labels(names, values, extra=""):
+    parts = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{value}"')
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Histogram:
+    def __init__(self, name, help, labels, buckets=METRIC_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = buckets
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * len(self.buckets), 0.0, 0]
+            i = bisect.bisect_left(self.buckets, value)
+            if i < len(self.buckets):
+                series[0][i] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = sorted((k, (list(v[0]), v[1], v[2])) for k, v in self._series.items())
+        for label_values, (counts, total, count) in series:
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                labels = _metric_labels(self.labels, label_values, f'le="{bound:g}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _metric_labels(self.labels, label_values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = _metric_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {total:.6f}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+class Counter:
+    def __init__(self, name, help, labels):
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_metric_labels(self.labels, label_values)} {value}")
+        return lines
+
+PHASE_SECONDS = Histogram("f1api_phase_seconds", "Sıcak yol aşamalarının süresi (saniye).", ("phase",))
+REQUEST_SECONDS = Histogram("f1api_request_seconds", "İstek süresi (saniye).", ("route", "status"))
+LOAD_FAILURES = Counter(
+    "f1api_load_failures_total", "Puan durumu için yüklenirken hata veren oturumlar.", ("kind", "reason")
+)
+
+@contextmanager
+def span(phase):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        PHASE_SECONDS.observe(elapsed, phase)
+        spans = request_spans.get()
+        if spans is not None:
+            spans.append((phase, elapsed))
+
+def server_timing(spans, total):
+    phases = {}
+    for phase, elapsed in spans:
+        duration, count = phases.get(phase, (0.0, 0))
+        phases[phase] = (duration + elapsed, count + 1)
+    parts = [f'{phase};dur={duration * 1000:.1f};desc="{count}x"' for phase, (duration, count) in phases.items()]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts)
+
+# Yüklenmiş Session nesneleri için süreç içi LRU önbellek.
+# Anahtar: (sezon, tur, oturum kodu). Aynı anahtar için eşzamanlı istekler
+# tek bir yüklemeyi paylaşır (single-flight).
+SESSION_CACHE_MAX_ENTRIES = int(os.environ.get("SESSION_CACHE_MAX_ENTRIES", "32"))
+SESSION_CACHE_MAX_BYTES = int(os.environ.get("SESSION_CACHE_MAX_BYTES", str(2 * 1024 ** 3)))
+
+# Uç noktaların ihtiyaç duyduğu veri parçaları; fastf1 load() bayraklarına karşılık gelir.
+# "results" profili yalnızca oturum bilgisi ve sonuçları yükler.
+SESSION_PARTS = ("laps", "telemetry", "weather", "messages")
+LOAD_PROFILES = {
+    "results": frozenset(),
+    "laps": frozenset({"laps"}),
+    "weather": frozenset({"weather"}),
+    "messages": frozenset({"messages"}),
+    "telemetry": frozenset({"laps", "telemetry"}),
+    # Yarış kontrol mesajları yalnızca UTC taşır; oturum zamanına hizalamak için gereken
+    # t0_date'i fastf1 yalnızca telemetri yüklenince hesaplar
+    "replay": frozenset({"laps", "telemetry", "messages"}),
+}
+
+def _frame_nbytes(obj):
+    if isinstance(obj, pd.DataFrame):
+        return int(obj.memory_usage(deep=True).sum())
+    if isinstance(obj, dict):
+        return sum(_frame_nbytes(v) for v in obj.values())
+    return 0
+
+def session_nbytes(session):
+    total = 0
+    for attr in ("results", "laps", "weather_data", "race_control_messages", "car_data", "pos_data"):
+        try:
+            total += _frame_nbytes(getattr(session, attr))
+        except Exception:
+            # Yüklenmemiş veri fastf1 tarafından hata olarak bildirilir
+            continue
+    return total
+
+class SessionCache:
+    def __init__(self, max_entries=SESSION_CACHE_MAX_ENTRIES, max_bytes=SESSION_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def get(self, season, round, code, parts=frozenset()):
+        key = (season, round, code)
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and parts <= entry[2]:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                future = self._inflight.get(key)
+                if future is not None:
+                    self.coalesced += 1
+                    owner = False
+                else:
+                    future = Future()
+                    self._inflight[key] = future
+                    self.misses += 1
+                    owner = True
+            if not owner:
+                # Süren yükleme bitince gereken parçalar tekrar kontrol edilir
+                future.result()
+                continue
+            try:
+                # Profil yükseltmesi de yeni bir oturuma yüklenir: fastf1 load() çerçeveleri
+                # yerinde değiştirdiği için diğer iş parçacıklarının tuttuğu oturuma dokunulmaz.
+                # Önceki parçalar fastf1 disk önbelleğinden gelir; kayıt kilit altında değiştirilir.
+                loaded = parts | (entry[2] if entry is not None else frozenset())
+                session = fresh_session(season, round, code, loaded)
+                self._store(key, session, loaded)
+                future.set_result(session)
+                return session
+            except BaseException as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+    def _store(self, key, session, parts):
+        nbytes = session_nbytes(session)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            self._entries[key] = (session, nbytes, parts)
+            self.current_bytes += nbytes
+            # En son eklenen oturum her zaman tutulur, eskiler atılır
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self.current_bytes > self.max_bytes
+            ):
+                _, (_, evicted_bytes, _) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_bytes
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def cached(self, season):
+        # Yükleme tetiklemeden, önbellekteki oturumları tur sırasıyla döner
+        with self._lock:
+            items = [(k, e[0]) for k, e in self._entries.items() if k[0] == season]
+        return sorted(items, key=lambda item: item[0][1])
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "inflight": len(self._inflight),
+                "keys": [list(k) + [sorted(e[2])] for k, e in self._entries.items()]
+            }
+
+session_cache = SessionCache()
+
+# fastf1 önbellek dizini FASTF1_CACHE_DIR ile verilirse ilk yüklemeden önce bir kez ayarlanır
+FASTF1_CACHE_DIR = os.environ.get("FASTF1_CACHE_DIR")
+_fastf1_cache_lock = threading.Lock()
+_fastf1_cache_configured = False
+
+def configure_fastf1_cache():
+    global _fastf1_cache_configured
+    if _fastf1_cache_configured:
+        return
+    with _fastf1_cache_lock:
+        if not _fastf1_cache_configured:
+            if FASTF1_CACHE_DIR:
+                os.makedirs(FASTF1_CACHE_DIR, exist_ok=True)
+                fastf1.Cache.enable_cache(FASTF1_CACHE_DIR)
+            _fastf1_cache_configured = True
+
+# İsteğe bağlı ısınma: sunucu trafik kabul etmeye başladıktan sonra ağır
+# bağımlılıklar ve fastf1 önbelleği arka planda hazırlanır.
+WARMUP_ON_STARTUP = os.environ.get("WARMUP_ON_STARTUP", "0") == "1"
+WARMUP_MODULES = (
+    "matplotlib.figure",
+    "matplotlib.backends.backend_agg",
+    "selenium.webdriver",
+    "selenium.webdriver.common.by",
+    "selenium.webdriver.chrome.options",
+    "selenium.webdriver.support.ui",
+    "bs4",
+    "lxml.etree",
+    "requests",
+    "pyarrow",
+    "pyarrow.parquet",
+)
+
+def warm_up():
+    configure_fastf1_cache()
+    for name in WARMUP_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+
+def start_warmup():
+    if WARMUP_ON_STARTUP:
+        threading.Thread(target=warm_up, name="warmup", daemon=True).start()
+
+def fresh_session(season, round, code, parts):
+    configure_fastf1_cache()
+    with span("get_session"):
+        session = fastf1.get_session(season, round, code)
+    with span("load"):
+        session.load(**{part: part in parts for part in SESSION_PARTS})
+    return session
+
+def load_session(season, round, code, profile="results"):
+    return session_cache.get(season, round, code, LOAD_PROFILES[profile])
+
+def load_detached_session(season, round, code, profile="results"):
+    # Arka plan işleri için: oturum LRU'ya konmaz, canlı isteklerin oturumlarını düşürmez
+    return fresh_session(season, round, code, LOAD_PROFILES[profile])
+
+# Sezon genelindeki uç noktalar turları sınırlı bir iş parçacığı havuzunda
+# paralel yükler. Oturumlar süreç içi önbellekte tutulduğu için süreç havuzu
+# yerine iş parçacıkları kullanılır.
+FANOUT_MAX_WORKERS = int(os.environ.get("FANOUT_MAX_WORKERS", str(min(8, os.cpu_count() or 1))))
+FANOUT_ROUND_TIMEOUT = float(os.environ.get("FANOUT_ROUND_TIMEOUT", "120"))
+fanout_executor = ThreadPoolExecutor(max_workers=FANOUT_MAX_WORKERS, thread_name_prefix="fanout")
+
+def fan_out(fn, items, timeout=FANOUT_ROUND_TIMEOUT):
+    # Her öğe için (sonuç, hata) çifti döner, sıra korunur.
+    # Zaman aşımı, turun havuzda çalışmaya başladığı andan itibaren sayılır.
+    started = {}
+    def run(i, item):
+        started[i] = time.monotonic()
+        return fn(item)
+    futures = {
+        fanout_executor.submit(contextvars.copy_context().run, run, i, item): i
+        for i, item in enumerate(items)
+    }
+    results = [None] * len(futures)
+    pending = set(futures)
+    while pending:
+        done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                results[futures[future]] = (future.result(), None)
+            except Exception as e:
+                results[futures[future]] = (None, e)
+        now = time.monotonic()
+        for future in list(pending):
+            i = futures[future]
+            if i in started and now - started[i] > timeout:
+                pending.discard(future)
+                results[i] = (None, TimeoutError(f"Tur {timeout:g} saniyede yüklenemedi."))
+    return results
+
+# Engelleyici ağır işler (oturum yükleme, çizim, kazıma) ayrı boyutlandırılmış
+# havuzlarda çalışır; olay döngüsü hafif uç noktalara açık kalır. Havuzun
+# kuyruğu doluysa istek bekletilmez, 503 ve Retry-After ile hemen reddedilir.
+class BoundedExecutor:
+    def __init__(self, name, workers, queue_size, retry_after):
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.rejected = 0
+
+    def _release(self, _):
+        with self._lock:
+            self.pending -= 1
+        self._slots.release()
+
+    async def run(self, fn, *args, **kwargs):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Sunucu şu anda yoğun, lütfen daha sonra tekrar deneyin.",
+                headers={"Retry-After": str(self.retry_after)}
+            )
+        with self._lock:
+            self.pending += 1
+        # İstek bağlamı (contextvars) iş parçacığına taşınır
+        context = contextvars.copy_context()
+        future = self._executor.submit(context.run, functools.partial(fn, *args, **kwargs))
+        # Yuva, iş gerçekten bitince (veya hiç başlamadan iptal edilince) serbest kalır
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "pending": self.pending,
+                "rejected": self.rejected
+            }
+
+load_executor = BoundedExecutor(
+    "load",
+    int(os.environ.get("LOAD_WORKERS", "8")),
+    int(os.environ.get("LOAD_QUEUE_SIZE", "32")),
+    retry_after=5
+)
+render_executor = BoundedExecutor(
+    "render",
+    int(os.environ.get("RENDER_WORKERS", "2")),
+    int(os.environ.get("RENDER_QUEUE_SIZE", "8")),
+    retry_after=2
+)
+scrape_executor = BoundedExecutor(
+    "scrape",
+    int(os.environ.get("SCRAPE_WORKERS", "2")),
+    int(os.environ.get("SCRAPE_QUEUE_SIZE", "4")),
+    retry_after=30
+)
+
+def offload(executor):
+    # Senkron bir uç noktayı verilen havuzda çalışan async uç noktaya çevirir
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await executor.run(fn, *args, **kwargs)
+        return wrapper
+    return decorator
+
+# Sütun bazlı DataFrame -> JSON dönüşümü. Satır satır str()/int()/float() yerine
+# her sütun tek seferde dönüştürülür; çıktı eski iterrows() döngüleriyle aynıdır,
+# yalnızca sayısal alanlardaki NaN/NaT değerleri null olur.
+_NS_PER_DAY = 86_400_000_000_000
+_TIMEDELTA_FORMATS = ("%d days %02d:%02d:%02d", "%d days %02d:%02d:%02d.%06d", "%d days %02d:%02d:%02d.%09d")
+
+def _with_nulls(out, mask, null):
+    for i in np.flatnonzero(mask):
+        out[i] = null
+    return out
+
+def _timedelta_strings(values):
+    nat = values.isna().to_numpy()
+    ns = values.to_numpy(dtype="timedelta64[ns]").view("int64").copy()
+    ns[nat] = 0
+    if (ns < 0).any():
+        # Negatif süreler pandas'ın kendi biçimiyle yazılır
+        return [str(v) for v in values]
+    days, rem = np.divmod(ns, _NS_PER_DAY)
+    seconds, frac = np.divmod(rem, 1_000_000_000)
+    hours, rem = np.divmod(seconds, 3600)
+    minutes, seconds = np.divmod(rem, 60)
+    micros, nanos = np.divmod(frac, 1000)
+    precision = np.where(nanos != 0, 2, np.where(micros != 0, 1, 0))
+    fraction = np.where(precision == 2, frac, micros)
+    out = [
+        _TIMEDELTA_FORMATS[p] % ((d, h, m, s, f) if p else (d, h, m, s))
+        for p, d, h, m, s, f in zip(
+            precision.tolist(), days.tolist(), hours.tolist(),
+            minutes.tolist(), seconds.tolist(), fraction.tolist()
+        )
+    ]
+    return _with_nulls(out, nat, "NaT")
+
+def _datetime_strings(values):
+    if values.dt.tz is None and not (values.dt.microsecond.any() or values.dt.nanosecond.any()):
+        return values.dt.strftime("%Y-%m-%d %H:%M:%S").fillna("NaT").tolist()
+    return [str(v) for v in values]
+
+def _to_str(values):
+    if pd.api.types.is_timedelta64_dtype(values):
+        return _timedelta_strings(values)
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return _datetime_strings(values)
+    return [str(v) for v in values.tolist()]
+
+def _to_int(values):
+    mask = values.isna().to_numpy()
+    return _with_nulls(values.where(~mask, 0).astype("int64").tolist(), mask, None)
+
+def _to_float(values):
+    mask = values.isna().to_numpy()
+    return _with_nulls(values.astype(float).tolist(), mask, None)
+
+def _to_bool(values):
+    return values.astype(bool).tolist()
+
+def _to_raw(values):
+    return _with_nulls(values.tolist(), values.isna().to_numpy(), None)
+
+FIELD_CONVERTERS = {
+    "str": _to_str,
+    "int": _to_int,
+    "float": _to_float,
+    "bool": _to_bool,
+    "raw": _to_raw,
+}
+
+def serialize_frame(df, fields):
+    # fields: (çıktı adı, sütun, tür[, sütun yoksa varsayılan değer])
+    with span("serialize"):
+        names = []
+        columns = []
+        for field in fields:
+            name, column, kind = field[:3]
+            if column in df.columns:
+                values = df[column]
+            else:
+                values = pd.Series([field[3] if len(field) > 3 else None] * len(df), dtype=object)
+            names.append(name)
+            columns.append(FIELD_CONVERTERS[kind](values))
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+RACE_FIELDS = [
+    ("round", "RoundNumber", "int"),
+    ("name", "EventName", "raw"),
+    ("country", "Country", "raw"),
+    ("location", "Location", "raw"),
+    ("date", "EventDate", "str"),
+]
+RESULT_FIELDS = [
+    ("position", "Position", "int"),
+    ("driver", "FullName", "raw"),
+    ("abbreviation", "Abbreviation", "raw"),
+    ("team", "TeamName", "raw"),
+    ("time", "Time", "str"),
+    ("status", "Status", "raw"),
+]
+QUALIFYING_FIELDS = [
+    ("position", "Position", "int"),
+    ("driver", "FullName", "raw"),
+    ("abbreviation", "Abbreviation", "raw"),
+    ("team", "TeamName", "raw"),
+    ("q1", "Q1", "str", ""),
+    ("q2", "Q2", "str", ""),
+    ("q3", "Q3", "str", ""),
+]
+DRIVER_FIELDS = [
+    ("number", "DriverNumber", "raw"),
+    ("name", "FullName", "raw"),
+    ("abbreviation", "Abbreviation", "raw"),
+    ("team", "TeamName", "raw"),
+]
+SPRINT_FIELDS = [
+    ("position", "Position", "int"),
+    ("driver", "FullName", "raw"),
+    ("abbreviation", "Abbreviation", "raw"),
+    ("team", "TeamName", "raw"),
+]
+LAP_TIME_FIELDS = [
+    ("lap_number", "LapNumber", "int"),
+    ("lap_time", "LapTime", "str"),
+    ("position", "Position", "int"),
+    ("pit", "PitInLap", "bool"),
+]
+SECTOR_TIME_FIELDS = [
+    ("lap_number", "LapNumber", "int"),
+    ("sector1", "Sector1Time", "str"),
+    ("sector2", "Sector2Time", "str"),
+    ("sector3", "Sector3Time", "str"),
+]
+TYRE_FIELDS = [
+    ("lap_number", "LapNumber", "int"),
+    ("compound", "Compound", "raw", None),
+    ("stint", "Stint", "int", 0),
+    ("fresh", "FreshTyre", "bool", False),
+]
+WEATHER_FIELDS = [
+    ("time", "Time", "str"),
+    ("air_temp", "AirTemp", "float"),
+    ("track_temp", "TrackTemp", "float"),
+    ("humidity", "Humidity", "float"),
+    ("rainfall", "Rainfall", "float"),
+    ("wind_speed", "WindSpeed", "float"),
+    ("wind_direction", "WindDirection", "float"),
+]
+EVENT_FIELDS = [
+    ("time", "UTC", "str"),
+    ("category", "Category", "raw", None),
+    ("message", "Message", "raw", None),
+]
+
+# Toplu tur uç noktasında isteğe bağlı eklenebilen sütun grupları
+LAP_INCLUDE_FIELDS = {
+    "sectors": SECTOR_TIME_FIELDS[1:],
+    "tyres": TYRE_FIELDS[1:],
+}
+
+def with_pit_flag(laps):
+    # fastf1 tur tablosunda PitInLap sütunu yok; pite giriş zamanı olan tur pit turudur
+    if "PitInLap" not in laps.columns:
+        laps = laps.assign(PitInLap=laps["PitInTime"].notna())
+    return laps
+
+# İçerik anlaşması: tablo döndüren uç noktalar Accept başlığına göre Arrow IPC,
+# Parquet veya satır satır akan NDJSON da verebilir. Varsayılan JSON'dur.
+# Arrow/Parquet doğrudan fastf1 DataFrame sütunlarından, kendi tipleriyle üretilir.
+# JSON dahil her varyant Vary: Accept taşır; paylaşılan önbellekler biçimleri karıştırmaz.
+JSON_MEDIA_TYPE = "application/json"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+TABLE_MEDIA_TYPES = {
+    JSON_MEDIA_TYPE: JSON_MEDIA_TYPE,
+    ARROW_STREAM_MEDIA_TYPE: ARROW_STREAM_MEDIA_TYPE,
+    PARQUET_MEDIA_TYPE: PARQUET_MEDIA_TYPE,
+    "application/x-parquet": PARQUET_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE: NDJSON_MEDIA_TYPE,
+}
+NDJSON_CHUNK_ROWS = 256
+
+def negotiate_table_format(accept):
+    best, best_q = JSON_MEDIA_TYPE, 0.0
+    for part in (accept or "").split(","):
+        media_type, _, params = part.partition(";")
+        media_type = media_type.strip().lower()
+        if media_type not in TABLE_MEDIA_TYPES:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > best_q:
+            best, best_q = TABLE_MEDIA_TYPES[media_type], q
+    return best
+
+def _columnar(values, kind):
+    if kind == "int":
+        return np.trunc(pd.to_numeric(values)).astype("Int64")
+    if kind == "float":
+        return pd.to_numeric(values).astype(float)
+    if kind == "bool":
+        return values.astype(bool)
+    if kind == "str" and not (
+        pd.api.types.is_timedelta64_dtype(values) or pd.api.types.is_datetime64_any_dtype(values)
+    ):
+        return values.astype(str)
+    return values
+
+def columnar_frame(df, fields):
+    data = {}
+    for field in fields:
+        name, column, kind = field[:3]
+        if column in df.columns:
+            values = df[column].reset_index(drop=True)
+        else:
+            values = pd.Series([field[3] if len(field) > 3 else None] * len(df), dtype=object)
+        data[name] = _columnar(values, kind)
+    return pd.DataFrame(data)
+
+def _ndjson_rows(df, fields):
+    for start in range(0, len(df), NDJSON_CHUNK_ROWS):
+        rows = serialize_frame(df.iloc[start:start + NDJSON_CHUNK_ROWS], fields)
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+def table_response(df, fields, media_type, metadata):
+    headers = {"Vary": "Accept"}
+    if media_type == NDJSON_MEDIA_TYPE:
+        return StreamingResponse(_ndjson_rows(df, fields), media_type=media_type, headers=headers)
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise HTTPException(status_code=406, detail="Bu biçim için sunucuda pyarrow kurulu değil.")
+    with span("serialize"):
+        table = pa.Table.from_pandas(columnar_frame(df, fields), preserve_index=False)
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata.update({str(k).encode(): str(v).encode() for k, v in metadata.items()})
+        table = table.replace_schema_metadata(schema_metadata)
+        sink = pa.BufferOutputStream()
+        if media_type == ARROW_STREAM_MEDIA_TYPE:
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+        else:
+            pq.write_table(table, sink)
+    return Response(content=sink.getvalue().to_pybytes(), media_type=media_type, headers=headers)
+
+# Etkinlik takvimi servisi: her sezon bir kez yüklenir ve TTL ile tutulur
+# (güncel ve gelecek sezonlar kısa süreli, geçmiş sezonlar kalıcı). Tur ve tarih
+# indeksleri ile yarış/sprint hafta sonu listeleri yükleme sırasında bir kez hesaplanır.
+SCHEDULE_TTL_CURRENT = float(os.environ.get("SCHEDULE_TTL_CURRENT", "3600"))
+# Testler dışındaki her format bir yarış hafta sonudur; sprint formatının adı sezona göre değişir
+NON_RACE_FORMATS = ("testing",)
+
+def has_sprint(event):
+    # fastf1 sprint hafta sonlarını sezona göre "sprint", "sprint_shootout" (2023)
+    # ve "sprint_qualifying" (2024+) olarak işaretler
+    return str(event["format"] or "").startswith("sprint")
+
+class SeasonSchedule:
+    def __init__(self, season, frame):
+        self.season = season
+        self.races = serialize_frame(frame, RACE_FIELDS)
+        formats = frame["EventFormat"].tolist() if "EventFormat" in frame.columns else [None] * len(frame)
+        dates = pd.to_datetime(frame["EventDate"]).tolist()
+        self.events = [
+            {"round": race["round"], "name": race["name"], "format": event_format, "date": date}
+            for race, event_format, date in zip(self.races, formats, dates)
+        ]
+        self.by_round = {event["round"]: i for i, event in enumerate(self.events)}
+        # Takvim sırasıyla yarış hafta sonları (test etkinlikleri hariç)
+        self._weekends = [e for e in self.events if e["format"] not in NON_RACE_FORMATS]
+        self._sprint_weekends = [e for e in self._weekends if has_sprint(e)]
+        dated = sorted((e["date"], e["round"]) for e in self.events if pd.notna(e["date"]))
+        self._dates = [d for d, _ in dated]
+        self._dated_rounds = [r for _, r in dated]
+
+    def race(self, round):
+        i = self.by_round.get(round)
+        return self.races[i] if i is not None else None
+
+    def event(self, round):
+        i = self.by_round.get(round)
+        return self.events[i] if i is not None else None
+
+    def weekends(self, sprint_only=False):
+        return list(self._sprint_weekends if sprint_only else self._weekends)
+
+    def completed_rounds(self, now=None):
+        now = pd.Timestamp.now() if now is None else now
+        return self._dated_rounds[:bisect.bisect_right(self._dates, now)]
+
+class ScheduleService:
+    def __init__(self, ttl_current=SCHEDULE_TTL_CURRENT):
+        self.ttl_current = ttl_current
+        self._seasons = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def _ttl(self, season):
+        return self.ttl_current if season >= pd.Timestamp.now().year else None
+
+    def get(self, season):
+        entry = self._seasons.get(season)
+        if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+            self.hits += 1
+            return entry[0]
+        with self._lock:
+            season_lock = self._locks.setdefault(season, threading.Lock())
+        with season_lock:
+            entry = self._seasons.get(season)
+            if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+                self.hits += 1
+                return entry[0]
+            try:
+                with span("schedule"):
+                    schedule = SeasonSchedule(season, fastf1.get_event_schedule(season))
+            except Exception:
+                if entry is not None:
+                    # Yenileme başarısızsa eski takvim kullanılmaya devam eder
+                    return entry[0]
+                raise
+            ttl = self._ttl(season)
+            self._seasons[season] = (schedule, None if ttl is None else time.monotonic() + ttl)
+            self.loads += 1
+            return schedule
+
+    def peek(self, season):
+        # Yükleme tetiklemeden önbellekteki takvimi (süresi geçmiş olsa da) döner
+        entry = self._seasons.get(season)
+        return entry[0] if entry is not None else None
+
+    def stats(self):
+        return {"seasons": sorted(self._seasons), "hits": self.hits, "loads": self.loads}
+
+schedule_service = ScheduleService()
+
+# Sürücü kayıt defteri: drivers_{season}.json dosyaları açılışta bir kez okunur,
+# tekrar eden kayıtlar ayıklanır ve numara, kısaltma ve takıma göre indekslenir.
+# Dosya yalnızca değiştirilme zamanı (mtime) değişince yeniden okunur. Dosyası
+# olmayan sezonlar önbellekteki oturum sonuçlarından doldurulur.
+DRIVERS_DIR = os.environ.get("DRIVERS_DIR", ".")
+DRIVERS_DERIVED_TTL = float(os.environ.get("DRIVERS_DERIVED_TTL", "600"))
+DRIVERS_FILE_PATTERN = re.compile(r"^drivers_(\d{4})\.json$")
+
+class SeasonDrivers:
+    def __init__(self, season, drivers, extra=None):
+        self.season = season
+        self.extra = extra or {}
+        self.drivers = []
+        seen = set()
+        for driver in drivers:
+            # Aynı numara ve takımla gelen ikinci kayıt (ör. isim varyasyonu) atlanır;
+            # sezon içinde takım değiştiren sürücünün iki kaydı da tutulur
+            key = (str(driver.get("number")), driver.get("team"))
+            if key in seen:
+                continue
+            seen.add(key)
+            self.drivers.append(driver)
+        self.by_number = {}
+        self.by_abbreviation = {}
+        self.by_team = {}
+        for driver in self.drivers:
+            self.by_number.setdefault(str(driver.get("number")), []).append(driver)
+            if driver.get("abbreviation"):
+                self.by_abbreviation.setdefault(driver["abbreviation"].upper(), []).append(driver)
+            if driver.get("team"):
+                self.by_team.setdefault(driver["team"].lower(), []).append(driver)
+
+    def find(self, identifier):
+        return self.by_number.get(identifier) or self.by_abbreviation.get(identifier.upper()) or []
+
+    def to_json(self):
+        return {"season": self.season, "drivers": self.drivers, **self.extra}
+
+class DriverRegistry:
+    def __init__(self, directory):
+        self.directory = directory
+        self._seasons = {}
+        self._lock = threading.Lock()
+
+    def _path(self, season):
+        return os.path.join(self.directory, f"drivers_{season}.json")
+
+    def load_all(self):
+        for name in os.listdir(self.directory):
+            match = DRIVERS_FILE_PATTERN.match(name)
+            if match:
+                self.get(int(match.group(1)))
+
+    def _load_file(self, season, path):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        extra = {k: v for k, v in data.items() if k not in ("season", "drivers")}
+        return SeasonDrivers(season, data.get("drivers", []), extra)
+
+    def _from_sessions(self, season):
+        drivers = {}
+        for _, session in session_cache.cached(season):
+            try:
+                results = session.results
+            except Exception:
+                continue
+            if results is None or results.empty:
+                continue
+            for driver in serialize_frame(results, DRIVER_FIELDS):
+                drivers[(driver["number"], driver["team"])] = driver
+        if not drivers:
+            return None
+        return SeasonDrivers(season, sorted(drivers.values(), key=lambda d: str(d["number"])))
+
+    def get(self, season):
+        path = self._path(season)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            mtime = None
+        entry = self._seasons.get(season)
+        if mtime is not None:
+            if entry is None or entry[1] != mtime:
+                with self._lock:
+                    entry = (self._load_file(season, path), mtime, None)
+                    self._seasons[season] = entry
+            return entry[0]
+        if entry is not None and entry[2] is not None and time.monotonic() < entry[2]:
+            return entry[0]
+        drivers = self._from_sessions(season)
+        if drivers is None:
+            return None
+        with self._lock:
+            self._seasons[season] = (drivers, None, time.monotonic() + DRIVERS_DERIVED_TTL)
+        return drivers
+
+driver_registry = DriverRegistry(DRIVERS_DIR)
+
+# HTTP önbellekleme ve sıkıştırma katmanı. Her 200 yanıtı gövdeden türetilen güçlü
+# bir ETag alır ve If-None-Match eşleşirse 304 döner. Bitmiş oturumlar (geçmiş
+# sezonlar ve güncel sezonda tamamlanıp oturmuş turlar) uzun ömürlü Cache-Control
+# ile gönderilir ve gövdeleri bellekte tutulur; tekrar gelen istekler uç noktayı
+# hiç çalıştırmaz. Büyük JSON/SVG gövdeleri brotli (kuruluysa) veya gzip ile sıkıştırılır.
+HTTP_CACHE_MAX_AGE_FINISHED = int(os.environ.get("HTTP_CACHE_MAX_AGE_FINISHED", str(7 * 24 * 3600)))
+HTTP_CACHE_MAX_AGE_CURRENT = int(os.environ.get("HTTP_CACHE_MAX_AGE_CURRENT", "60"))
+RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("RESPONSE_CACHE_MAX_BYTES", str(256 * 1024 ** 2)))
+COMPRESS_MIN_SIZE = int(os.environ.get("COMPRESS_MIN_SIZE", "1024"))
+COMPRESS_GZIP_LEVEL = 6
+COMPRESS_BROTLI_QUALITY = 5
+COMPRESSIBLE_TYPES = ("application/json", "image/svg+xml", "text/")
+# Bu yolların verisi oturumlardan gelmez (dosya, Parquet deposu, önbellek durumu, kazıma);
+# ETag alırlar ama istemci önbelleğe almadan önce doğrulamalıdır
+HTTP_CACHE_REVALIDATE_PREFIXES = ("/drivers", "/career", "/cache", "/scrape-")
+HTTP_CACHE_SKIP_PREFIXES = ("/static",)
+
+@functools.lru_cache(maxsize=None)
+def _brotli():
+    try:
+        return importlib.import_module("brotli")
+    except ImportError:
+        return None
+
+def choose_encoding(accept_encoding):
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if token:
+            accepted[token] = q
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and _brotli() is None:
+            continue
+        if accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+def compress_body(body, encoding):
+    if encoding == "br":
+        return _brotli().compress(body, quality=COMPRESS_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESS_GZIP_LEVEL, mtime=0)
+
+def etag_matches(if_none_match, etags):
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate in etags:
+            return True
+    return False
+
+def round_settled(season, round, schedule, now=None):
+    # Geçmiş sezonlar ve güncel sezonda üzerinden STANDINGS_SETTLE_DAYS geçmiş turlar değişmez
+    now = pd.Timestamp.now() if now is None else now
+    if season < now.year:
+        return True
+    if round is None or schedule is None:
+        return False
+    return round in schedule.completed_rounds(now - pd.Timedelta(days=STANDINGS_SETTLE_DAYS))
+
+def cache_policy(path, path_params, now=None):
+    if path.startswith(HTTP_CACHE_REVALIDATE_PREFIXES):
+        return "no-cache"
+    try:
+        season = int(path_params["season"])
+        round = int(path_params["round"]) if "round" in path_params else None
+    except (KeyError, ValueError):
+        return "no-cache"
+    if round_settled(season, round, schedule_service.peek(season), now):
+        return "finished"
+    return "current"
+
+# Bir turu geçici bir hatayla eksik kalan yanıt (ör. no_data_rounds'a hata yüzünden
+# düşen tur) kalıcı olarak önbelleğe alınmaz; işaretlenirse "current" ile döner.
+response_partial = contextvars.ContextVar("response_partial", default=None)
+
+def mark_partial():
+    flags = response_partial.get()
+    if flags is not None:
+        flags.append(True)
+
+CACHE_CONTROL = {
+    "finished": f"public, max-age={HTTP_CACHE_MAX_AGE_FINISHED}, immutable",
+    "current": f"public, max-age={HTTP_CACHE_MAX_AGE_CURRENT}",
+    "no-cache": "no-cache",
+}
+
+class CachedBody:
+    def __init__(self, body, headers, policy, route=None):
+        self.route = route
+        self.body = body
+        self.headers = headers
+        self.policy = policy
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.compressible = (
+            len(body) >= COMPRESS_MIN_SIZE
+            and headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+        )
+        self.variants = {}
+        if self.compressible:
+            vary = [v.strip() for v in headers.get("vary", "").split(",") if v.strip()]
+            self.headers["vary"] = ", ".join(vary + ["Accept-Encoding"])
+
+    def nbytes(self):
+        return len(self.body) + sum(len(v) for v in self.variants.values())
+
+    async def respond(self, encoding, if_none_match):
+        if not self.compressible:
+            encoding = None
+        etag = self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+        headers = dict(self.headers)
+        headers["etag"] = etag
+        headers["cache-control"] = CACHE_CONTROL[self.policy]
+        if etag_matches(if_none_match, (etag, self.etag)):
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers)
+        if encoding is None:
+            return Response(content=self.body, headers=headers)
+        data = self.variants.get(encoding)
+        if data is None:
+            with span("compress"):
+                data = await asyncio.to_thread(compress_body, self.body, encoding)
+            self.variants[encoding] = data
+        headers["content-encoding"] = encoding
+        return Response(content=data, headers=headers)
+
+class ResponseCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, body):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+            size = body.nbytes()
+            self._entries[key] = (body, size)
+            self.current_bytes += size
+            while self._entries and self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    def resize(self, key, body):
+        # Sıkıştırılmış varyant eklendiğinde boyut hesabı güncellenir
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] is body:
+                size = body.nbytes()
+                self.current_bytes += size - entry[1]
+                self._entries[key] = (body, size)
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+response_cache = ResponseCache(RESPONSE_CACHE_MAX_BYTES)
+
+def route_path(scope):
+    # Eşleşen rotanın şablonu; bellek önbelleğinden dönen yanıtlarda kaydedilmiş rota
+    route = scope.get("route")
+    return getattr(route, "path", None) or scope.get("cached_route") or "unmatched"
+
+@app.middleware("http")
+async def http_cache(request, call_next):
+    if request.method != "GET" or request.url.path.startswith(HTTP_CACHE_SKIP_PREFIXES):
+        return await call_next(request)
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if_none_match = request.headers.get("if-none-match")
+    key = (request.url.path, request.url.query, request.headers.get("accept"))
+    partial = []
+    response_partial.set(partial)
+    cached = response_cache.get(key)
+    if cached is not None:
+        request.scope["cached_route"] = cached.route
+        response = await cached.respond(encoding, if_none_match)
+        response_cache.resize(key, cached)
+        return response
+    response = await call_next(request)
+    content_type = response.headers.get("content-type", "")
+    # Hatalar, akış yanıtları (NDJSON, SSE) ve kendi önbellek başlığını koyan yanıtlar olduğu gibi geçer
+    if response.status_code != 200 or "cache-control" in response.headers or content_type.startswith(
+        (NDJSON_MEDIA_TYPE, "text/event-stream")
+    ):
+        return response
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    headers = {k: v for k, v in response.headers.items() if k not in ("content-length", "etag")}
+    policy = cache_policy(request.url.path, request.scope.get("path_params", {}))
+    if partial and policy == "finished":
+        policy = "current"
+    cached = CachedBody(body, headers, policy, route_path(request.scope))
+    if policy == "finished":
+        response_cache.put(key, cached)
+    response = await cached.respond(encoding, if_none_match)
+    if policy == "finished":
+        response_cache.resize(key, cached)
+    return response
+
+@app.middleware("http")
+async def observe_request(request, call_next):
+    # En dıştaki ara katman: bellek önbelleğinden dönen yanıtlar da ölçülür
+    spans = []
+    request_spans.set(spans)
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed = time.perf_counter() - start
+    REQUEST_SECONDS.observe(elapsed, route_path(request.scope), str(response.status_code))
+    if SERVER_TIMING_ENABLED:
+        response.headers["Server-Timing"] = server_timing(spans, elapsed)
+    return response
+
+# İşlenmiş yanıt verisi için diskte, işçi süreçler arasında paylaşılan önbellek.
+# Değişmeyecek turların payload'ları msgpack olarak yazılır, okurken mmap ile
+# açılır. Yazma ve ilk hesaplama dosya kilidi (fcntl) altında yapılır; böylece aynı
+# makinedeki uvicorn işçileri bir turu yalnızca bir kez işler. Anahtar (uç nokta,
+# sezon, tur, parametreler, kod sürümü) olduğundan main.py değişince eski kayıtlar
+# kendiliğinden geçersiz kalır. fcntl olmayan platformlarda kilitsiz çalışır.
+PAYLOAD_CACHE_DIR = os.environ.get("PAYLOAD_CACHE_DIR", os.path.join("cache", "payloads"))
+PAYLOAD_CACHE_ENABLED = os.environ.get("PAYLOAD_CACHE_ENABLED", "1") != "0"
+with open(__file__, "rb") as _source:
+    CODE_VERSION = hashlib.blake2b(_source.read(), digest_size=8).hexdigest()
+
+def _msgpack_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"msgpack ile yazılamayan tip: {type(value).__name__}")
+
+class PayloadCache:
+    def __init__(self, directory, version, enabled=True):
+        self.directory = os.path.join(directory, version)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+
+    def _path(self, endpoint, season, round, params):
+        digest = hashlib.blake2b(
+            json.dumps(params, sort_keys=True, default=str).encode(), digest_size=8
+        ).hexdigest()
+        return os.path.join(self.directory, endpoint, str(season), f"{round}-{digest}.msgpack")
+
+    def _read(self, path):
+        try:
+            with open(path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return msgpack.unpackb(mm, raw=False)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, msgpack.UnpackException):
+            # Boş ya da bozuk dosya ıska sayılır ve yeniden yazılır
+            self.errors += 1
+            return None
+
+    def _write(self, path, payload):
+        data = msgpack.packb(payload, default=_msgpack_default, use_bin_type=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.writes += 1
+
+    @contextmanager
+    def _locked(self, path):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def get_or_compute(self, endpoint, season, round, params, compute, settled=True):
+        # Henüz değişebilecek veriler (settled=False) ve None sonuçlar diske yazılmaz
+        if not self.enabled or not settled:
+            return compute()
+        path = self._path(endpoint, season, round, params)
+        with span("payload_read"):
+            payload = self._read(path)
+        if payload is not None:
+            self.hits += 1
+            return payload
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._locked(path):
+            payload = self._read(path)
+            if payload is not None:
+                # Başka bir işçi kilidi tutarken hesaplayıp yazdı
+                self.hits += 1
+                return payload
+            self.misses += 1
+            payload = compute()
+            if payload is not None:
+                try:
+                    self._write(path, payload)
+                except (OSError, TypeError, ValueError):
+                    self.errors += 1
+        return payload
+
+    def stats(self):
+        return {
+            "directory": self.directory,
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors
+        }
+
+payload_cache = PayloadCache(PAYLOAD_CACHE_DIR, CODE_VERSION, PAYLOAD_CACHE_ENABLED)
+
+def payload_settled(season, round):
+    if season < pd.Timestamp.now().year:
+        return True
+    try:
+        schedule = schedule_service.get(season)
+    except Exception:
+        schedule = None
+    return round_settled(season, round, schedule)
+
 @app.get("/")
-def root():
+async def root():
     return {"message": "F1 RESTful API'ye hoş geldiniz!"}
 
 @app.get("/races/{season}")
+@offload(load_executor)
 def get_races(season: int):
     try:
-        schedule = fastf1.get_event_schedule(season)
-        races = []
-        for _, row in schedule.iterrows():
-            races.append({
-                "round": int(row["RoundNumber"]),
-                "name": row["EventName"],
-                "country": row["Country"],
-                "location": row["Location"],
-                "date": str(row["EventDate"])
-            })
+        races = schedule_service.get(season).races
         return {"season": season, "races": races}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}")
+@offload(load_executor)
 def get_race_detail(season: int, round: int):
     try:
-        schedule = fastf1.get_event_schedule(season)
-        row = schedule[schedule["RoundNumber"] == round].iloc[0]
-        race = {
-            "round": int(row["RoundNumber"]),
-            "name": row["EventName"],
-            "country": row["Country"],
-            "location": row["Location"],
-            "date": str(row["EventDate"])
-        }
+        race = schedule_service.get(season).race(round)
+        if race is None:
+            raise HTTPException(status_code=404, detail=f"Yarış bulunamadı: {season} sezonunda {round}. tur yok.")
         return {"season": season, "race": race}
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(status_code=404, detail="Yarış bulunamadı: " + str(e))
 
+def race_results_payload(season, round):
+    def compute():
+        results = load_session(season, round, "R").results
+        return None if results is None else serialize_frame(results, RESULT_FIELDS)
+    return payload_cache.get_or_compute("results", season, round, {}, compute, payload_settled(season, round))
+
 @app.get("/races/{season}/{round}/results")
+@offload(load_executor)
 def get_race_results(season: int, round: int):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
-        results = session.results
-        if results is None:
+        race_results = race_results_payload(season, round)
+        if race_results is None:
             raise HTTPException(status_code=404, detail="Yarış sonucu bulunamadı.")
-        race_results = []
-        for _, row in results.iterrows():
-            race_results.append({
-                "position": int(row["Position"]),
-                "driver": row["FullName"],
-                "abbreviation": row["Abbreviation"],
-                "team": row["TeamName"],
-                "time": str(row["Time"]),
-                "status": row["Status"]
-            })
         return {"season": season, "round": round, "results": race_results}
     except HTTPException as e:
         raise e
@@ -90,24 +1300,14 @@ def get_race_results(season: int, round: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}/qualifying")
+@offload(load_executor)
 def get_qualifying_results(season: int, round: int):
     try:
-        session = fastf1.get_session(season, round, "Q")
-        session.load()
+        session = load_session(season, round, "Q")
         results = session.results
         if results is None:
             raise HTTPException(status_code=404, detail="Sıralama sonucu bulunamadı.")
-        quali_results = []
-        for _, row in results.iterrows():
-            quali_results.append({
-                "position": int(row["Position"]),
-                "driver": row["FullName"],
-                "abbreviation": row["Abbreviation"],
-                "team": row["TeamName"],
-                "q1": str(row.get("Q1", "")),
-                "q2": str(row.get("Q2", "")),
-                "q3": str(row.get("Q3", ""))
-            })
+        quali_results = serialize_frame(results, QUALIFYING_FIELDS)
         return {"season": season, "round": round, "results": quali_results}
     except HTTPException as e:
         raise e
@@ -115,53 +1315,98 @@ def get_qualifying_results(season: int, round: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}/drivers")
+@offload(load_executor)
 def get_race_drivers(season: int, round: int):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
+        session = load_session(season, round, "R")
         results = session.results
         if results is None:
             raise HTTPException(status_code=404, detail="Yarış sürücüleri bulunamadı.")
-        drivers = []
-        for _, row in results.iterrows():
-            drivers.append({
-                "number": row["DriverNumber"],
-                "name": row["FullName"],
-                "abbreviation": row["Abbreviation"],
-                "team": row["TeamName"]
-            })
+        drivers = serialize_frame(results, DRIVER_FIELDS)
         return {"season": season, "round": round, "drivers": drivers}
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    return {
+        "sessions": session_cache.stats(),
+        "schedules": schedule_service.stats(),
+        "responses": response_cache.stats(),
+        "payloads": payload_cache.stats(),
+        "executors": {e.name: e.stats() for e in (load_executor, render_executor, scrape_executor)},
+        "scrape": scrape_cache.stats(),
+        "browsers": browser_pool.stats(),
+        "track_maps": track_map_cache.stats(),
+        "store": columnar_store.stats()
+    }
+
+@app.get("/metrics")
+async def get_metrics():
+    lines = []
+    for metric in (PHASE_SECONDS, REQUEST_SECONDS, LOAD_FAILURES):
+        lines += metric.render()
+    caches = {
+        "sessions": session_cache.stats(),
+        "schedules": dict(schedule_service.stats(), misses=schedule_service.loads),
+        "responses": response_cache.stats(),
+        "payloads": payload_cache.stats(),
+        "scrape": scrape_cache.stats(),
+        "track_maps": track_map_cache.stats(),
+    }
+    for name, help in (("hits", "Önbellek isabetleri."), ("misses", "Önbellek ıskaları.")):
+        lines += [f"# HELP f1api_cache_{name}_total {help}", f"# TYPE f1api_cache_{name}_total counter"]
+        lines += [f'f1api_cache_{name}_total{{cache="{cache}"}} {stats[name]}' for cache, stats in caches.items()]
+    lines += [
+        "# HELP f1api_session_loads_inflight Sürmekte olan oturum yüklemeleri.",
+        "# TYPE f1api_session_loads_inflight gauge",
+        f"f1api_session_loads_inflight {caches['sessions']['inflight']}",
+        "# HELP f1api_executor_pending Havuzlarda çalışan ya da sırada bekleyen işler.",
+        "# TYPE f1api_executor_pending gauge",
+    ]
+    executors = (load_executor, render_executor, scrape_executor)
+    lines += [f'f1api_executor_pending{{executor="{e.name}"}} {e.stats()["pending"]}' for e in executors]
+    lines += [
+        "# HELP f1api_executor_rejected_total 503 ile geri çevrilen işler.",
+        "# TYPE f1api_executor_rejected_total counter",
+    ]
+    lines += [f'f1api_executor_rejected_total{{executor="{e.name}"}} {e.stats()["rejected"]}' for e in executors]
+    return Response(content="\n".join(lines) + "\n", media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/drivers/{season}")
-def get_drivers(season: int):
-    json_path = f"drivers_{season}.json"
-    if os.path.exists(json_path):
-        with open(json_path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    else:
+async def get_drivers(season: int, team: str = None):
+    drivers = driver_registry.get(season)
+    if drivers is None:
         raise HTTPException(status_code=404, detail="Sürücü verisi bulunamadı.")
+    if team is not None:
+        return {"season": season, "drivers": drivers.by_team.get(team.lower(), [])}
+    return drivers.to_json()
+
+@app.get("/drivers/{season}/{driver_id}")
+async def get_driver(season: int, driver_id: str):
+    drivers = driver_registry.get(season)
+    entries = drivers.find(driver_id) if drivers is not None else []
+    if not entries:
+        raise HTTPException(status_code=404, detail="Sürücü bulunamadı.")
+    driver = dict(entries[-1])
+    driver["teams"] = [e["team"] for e in entries]
+    return {"season": season, "driver": driver}
 
 @app.get("/constructors/{season}")
+@offload(load_executor)
 def get_constructors(season: int):
     try:
-        schedule = fastf1.get_event_schedule(season)
+        rounds = [e["round"] for e in schedule_service.get(season).weekends()]
         all_teams = set()
-        for _, row in schedule.iterrows():
-            if row.get("EventFormat") not in ["conventional", "sprint"]:
-                continue
-            try:
-                event = fastf1.get_session(season, int(row["RoundNumber"]), "R")
-                event.load()
-                results = event.results
-                if results is not None:
-                    for _, driver_row in results.iterrows():
-                        all_teams.add(driver_row["TeamName"])
-            except Exception:
+        for event, error in fan_out(lambda round_number: load_session(season, round_number, "R"), rounds):
+            if error is not None:
+                mark_partial()
                 continue
+            results = event.results
+            if results is not None:
+                all_teams.update(results["TeamName"].tolist())
         teams = sorted(list(all_teams))
         if not teams:
             raise HTTPException(status_code=404, detail="Takım verisi bulunamadı.")
@@ -172,43 +1417,83 @@ def get_constructors(season: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}/lap-times/{driver}")
-def get_lap_times(season: int, round: int, driver: str):
+@offload(load_executor)
+def get_lap_times(season: int, round: int, driver: str, response: Response, accept: str = Header(None)):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
+        session = load_session(season, round, "R", "laps")
         laps = session.laps.pick_driver(driver)
         if laps.empty:
             raise HTTPException(status_code=404, detail="Tur zamanı verisi bulunamadı.")
-        lap_times = []
-        for _, row in laps.iterrows():
-            lap_times.append({
-                "lap_number": int(row["LapNumber"]),
-                "lap_time": str(row["LapTime"]),
-                "position": int(row["Position"]),
-                "pit": bool(row["PitInLap"])
-            })
+        media_type = negotiate_table_format(accept)
+        response.headers["Vary"] = "Accept"
+        if media_type != JSON_MEDIA_TYPE:
+            metadata = {"season": season, "round": round, "driver": driver}
+            return table_response(with_pit_flag(laps), LAP_TIME_FIELDS, media_type, metadata)
+        lap_times = serialize_frame(with_pit_flag(laps), LAP_TIME_FIELDS)
         return {"season": season, "round": round, "driver": driver, "lap_times": lap_times}
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/races/{season}/{round}/laps")
+@offload(load_executor)
+def get_race_laps(season: int, round: int, response: Response, drivers: str = None, include: str = None, accept: str = Header(None)):
+    try:
+        includes = [i.strip() for i in include.split(",") if i.strip()] if include else []
+        unknown = [i for i in includes if i not in LAP_INCLUDE_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Geçersiz include değeri: {', '.join(unknown)}")
+        requested = [d.strip().upper() for d in drivers.split(",") if d.strip()] if drivers else []
+        fields = [("driver", "Driver", "raw")] + LAP_TIME_FIELDS
+        for i in includes:
+            fields += LAP_INCLUDE_FIELDS[i]
+        media_type = negotiate_table_format(accept)
+        response.headers["Vary"] = "Accept"
+
+        def select_laps():
+            laps = load_session(season, round, "R", "laps").laps
+            if requested:
+                # Sürücüler kısaltma ya da numara ile tek bir maske üzerinden seçilir
+                laps = laps[laps["Driver"].isin(requested) | laps["DriverNumber"].isin(requested)]
+            if laps.empty:
+                raise HTTPException(status_code=404, detail="Tur zamanı verisi bulunamadı.")
+            return with_pit_flag(laps)
+
+        if media_type != JSON_MEDIA_TYPE:
+            return table_response(select_laps(), fields, media_type, {"season": season, "round": round})
+
+        def compute():
+            laps = select_laps()
+            found = set(laps["Driver"].unique()) | set(laps["DriverNumber"].unique())
+            return {
+                "season": season,
+                "round": round,
+                "drivers": sorted(laps["Driver"].unique().tolist()),
+                "missing_drivers": [d for d in requested if d not in found],
+                "laps": serialize_frame(laps, fields)
+            }
+        params = {"drivers": requested, "include": includes}
+        return payload_cache.get_or_compute("laps", season, round, params, compute, payload_settled(season, round))
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/races/{season}/{round}/sector-times/{driver}")
-def get_sector_times(season: int, round: int, driver: str):
+@offload(load_executor)
+def get_sector_times(season: int, round: int, driver: str, response: Response, accept: str = Header(None)):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
+        session = load_session(season, round, "R", "laps")
         laps = session.laps.pick_driver(driver)
         if laps.empty:
             raise HTTPException(status_code=404, detail="Sektör zamanı verisi bulunamadı.")
-        sector_times = []
-        for _, row in laps.iterrows():
-            sector_times.append({
-                "lap_number": int(row["LapNumber"]),
-                "sector1": str(row["Sector1Time"]),
-                "sector2": str(row["Sector2Time"]),
-                "sector3": str(row["Sector3Time"])
-            })
+        media_type = negotiate_table_format(accept)
+        response.headers["Vary"] = "Accept"
+        if media_type != JSON_MEDIA_TYPE:
+            metadata = {"season": season, "round": round, "driver": driver}
+            return table_response(laps, SECTOR_TIME_FIELDS, media_type, metadata)
+        sector_times = serialize_frame(laps, SECTOR_TIME_FIELDS)
         return {"season": season, "round": round, "driver": driver, "sector_times": sector_times}
     except HTTPException as e:
         raise e
@@ -216,21 +1501,19 @@ def get_sector_times(season: int, round: int, driver: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}/tyres/{driver}")
-def get_tyre_data(season: int, round: int, driver: str):
+@offload(load_executor)
+def get_tyre_data(season: int, round: int, driver: str, response: Response, accept: str = Header(None)):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
+        session = load_session(season, round, "R", "laps")
         laps = session.laps.pick_driver(driver)
         if laps.empty or "Stint" not in laps.columns:
             raise HTTPException(status_code=404, detail="Lastik verisi bulunamadı.")
-        tyre_data = []
-        for _, row in laps.iterrows():
-            tyre_data.append({
-                "lap_number": int(row["LapNumber"]),
-                "compound": row.get("Compound", None),
-                "stint": int(row.get("Stint", 0)),
-                "fresh": bool(row.get("FreshTyre", False))
-            })
+        media_type = negotiate_table_format(accept)
+        response.headers["Vary"] = "Accept"
+        if media_type != JSON_MEDIA_TYPE:
+            metadata = {"season": season, "round": round, "driver": driver}
+            return table_response(laps, TYRE_FIELDS, media_type, metadata)
+        tyre_data = serialize_frame(laps, TYRE_FIELDS)
         return {"season": season, "round": round, "driver": driver, "tyre_data": tyre_data}
     except HTTPException as e:
         raise e
@@ -238,24 +1521,18 @@ def get_tyre_data(season: int, round: int, driver: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}/weather")
-def get_weather_data(season: int, round: int):
+@offload(load_executor)
+def get_weather_data(season: int, round: int, response: Response, accept: str = Header(None)):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
+        session = load_session(season, round, "R", "weather")
         weather = session.weather_data
         if weather is None or weather.empty:
             raise HTTPException(status_code=404, detail="Hava durumu verisi bulunamadı.")
-        weather_list = []
-        for _, row in weather.iterrows():
-            weather_list.append({
-                "time": str(row["Time"]),
-                "air_temp": float(row["AirTemp"]),
-                "track_temp": float(row["TrackTemp"]),
-                "humidity": float(row["Humidity"]),
-                "rainfall": float(row["Rainfall"]),
-                "wind_speed": float(row["WindSpeed"]),
-                "wind_direction": float(row["WindDirection"])
-            })
+        media_type = negotiate_table_format(accept)
+        response.headers["Vary"] = "Accept"
+        if media_type != JSON_MEDIA_TYPE:
+            return table_response(weather, WEATHER_FIELDS, media_type, {"season": season, "round": round})
+        weather_list = serialize_frame(weather, WEATHER_FIELDS)
         return {"season": season, "round": round, "weather": weather_list}
     except HTTPException as e:
         raise e
@@ -263,337 +1540,1719 @@ def get_weather_data(season: int, round: int):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/races/{season}/{round}/events")
+@offload(load_executor)
 def get_race_events(season: int, round: int):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
+        session = load_session(season, round, "R", "messages")
         messages = session.race_control_messages
         if messages is None or messages.empty:
             raise HTTPException(status_code=404, detail="Yarış olayı verisi bulunamadı.")
-        events = []
-        for _, row in messages.iterrows():
-            events.append({
-                "time": str(row["UTC"]),
-                "category": row.get("Category", None),
-                "message": row.get("Message", None)
-            })
+        events = serialize_frame(messages, EVENT_FIELDS)
         return {"season": season, "round": round, "events": events}
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/standings/drivers/{season}")
-def get_driver_standings_local(season: int):
+# Yarış temposu ve stint analizi: session.laps üzerinde gruplanmış pandas
+# işlemleriyle hesaplanır. Pit giriş/çıkış turları, ilk tur ve süresi olmayan turlar
+# dışarıda bırakılır. Tüm süreler saniyedir. Bozulma eğimi (saniye/tur) her stint
+# içinde lastik yaşı ve tur süresi ortalamadan arındırılarak en küçük kareler ile
+# bulunur; böylece farklı tempodaki sürücüler aynı hamurda birleştirilebilir.
+# Sonuç oturum nesnesine bağlı (weakref) tutulur; oturuma kalıcı önbellek eklenir.
+PACE_DECIMALS = 3
+_pace_by_session = weakref.WeakKeyDictionary()
+_pace_lock = threading.Lock()
+
+def _records(frame):
+    frame = frame.round(PACE_DECIMALS)
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+def _degradation(group_sums):
+    # Eğim = Σ(dx·dy) / Σ(dx²); tek turluk ya da yaşı değişmeyen stintlerde tanımsız
+    slope = group_sums["dxdy"] / group_sums["dxdx"].where(group_sums["dxdx"] > 0)
+    return slope
+
+def pace_frames(laps):
+    laps = laps[laps["LapTime"].notna() & (laps["LapNumber"] > 1)]
+    for column in ("PitInTime", "PitOutTime"):
+        if column in laps.columns:
+            laps = laps[laps[column].isna()]
+    if "Deleted" in laps.columns:
+        laps = laps[laps["Deleted"] != True]
+    if laps.empty:
+        return None
+    age = laps["TyreLife"] if "TyreLife" in laps.columns else laps.groupby(["Driver", "Stint"]).cumcount().astype(float)
+    frame = pd.DataFrame({
+        "driver": laps["Driver"].to_numpy(),
+        "team": laps["Team"].to_numpy() if "Team" in laps.columns else None,
+        "stint": laps["Stint"].to_numpy(),
+        "compound": laps["Compound"].to_numpy() if "Compound" in laps.columns else None,
+        "lap": laps["LapNumber"].to_numpy(),
+        "age": age.to_numpy(dtype=float),
+        "seconds": laps["LapTime"].dt.total_seconds().to_numpy(),
+    })
+    stint_groups = frame.groupby(["driver", "stint"], sort=False)
+    frame["dx"] = frame["age"] - stint_groups["age"].transform("mean")
+    frame["dy"] = frame["seconds"] - stint_groups["seconds"].transform("mean")
+    frame["dxdy"] = frame["dx"] * frame["dy"]
+    frame["dxdx"] = frame["dx"] * frame["dx"]
+    return frame
+
+def compute_pace(session):
+    laps = session.laps
+    frame = pace_frames(laps) if laps is not None and not laps.empty else None
+    if frame is None:
+        return None
+    with span("pace"):
+        drivers = frame.groupby("driver").agg(
+            team=("team", "last"), laps=("seconds", "size"),
+            median_lap=("seconds", "median"), best_lap=("seconds", "min"),
+        )
+        drivers["median_gap"] = drivers["median_lap"] - drivers["median_lap"].min()
+        drivers["best_gap"] = drivers["best_lap"] - drivers["best_lap"].min()
+        # Yarış farkı: sürücünün son turunu bitirdiği an ile liderin aynı turu bitirdiği an
+        timed = laps[laps["Time"].notna()]
+        leader_time = timed.groupby("LapNumber")["Time"].transform("min")
+        gaps = pd.DataFrame({
+            "driver": timed["Driver"].to_numpy(),
+            "lap": timed["LapNumber"].to_numpy(),
+            "gap": (timed["Time"] - leader_time).dt.total_seconds().to_numpy(),
+        }).sort_values(["driver", "lap"]).groupby("driver").last()
+        drivers["race_gap"] = gaps["gap"].reindex(drivers.index)
+        drivers["race_gap_lap"] = gaps["lap"].reindex(drivers.index)
+        drivers = drivers.sort_values("median_lap").reset_index()
+
+        stint_groups = frame.groupby(["driver", "stint"])
+        stints = stint_groups.agg(
+            compound=("compound", "first"), first_lap=("lap", "min"), last_lap=("lap", "max"),
+            laps=("seconds", "size"), median_lap=("seconds", "median"), best_lap=("seconds", "min"),
+        )
+        stints["degradation"] = _degradation(stint_groups[["dxdy", "dxdx"]].sum())
+        stints = stints.reset_index()
+
+        compound_groups = frame.groupby("compound")
+        compounds = compound_groups.agg(laps=("seconds", "size"), median_lap=("seconds", "median"))
+        compounds["stints"] = frame.drop_duplicates(["driver", "stint"]).groupby("compound").size()
+        compounds["degradation"] = _degradation(compound_groups[["dxdy", "dxdx"]].sum())
+        compounds = compounds.reset_index()
+    for table in (drivers, stints):
+        for column in ("race_gap_lap", "first_lap", "last_lap", "stint"):
+            if column in table.columns:
+                table[column] = table[column].astype("Int64")
+    return {
+        "drivers": _records(drivers),
+        "stints": _records(stints),
+        "compounds": _records(compounds)
+    }
+
+def session_pace(session):
+    with _pace_lock:
+        if session in _pace_by_session:
+            return _pace_by_session[session]
+    pace = compute_pace(session)
+    with _pace_lock:
+        _pace_by_session[session] = pace
+    return pace
+
+@app.get("/races/{season}/{round}/pace")
+@offload(load_executor)
+def get_race_pace(season: int, round: int):
     try:
-        schedule = fastf1.get_event_schedule(season)
-        driver_points = {}
-        driver_names = {}
-        no_data_rounds = []
-        for _, row in schedule.iterrows():
-            if row.get("EventFormat") not in ["conventional", "sprint"]:
+        pace = payload_cache.get_or_compute(
+            "pace", season, round, {},
+            lambda: session_pace(load_session(season, round, "R", "laps")),
+            payload_settled(season, round)
+        )
+        if pace is None:
+            raise HTTPException(status_code=404, detail="Tempo verisi bulunamadı.")
+        return {"season": season, "round": round, **pace}
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Telemetri: bir turun araç ve konum verisi (fastf1 Lap.get_telemetry, mesafe dahil)
+# sütun dizileri olarak döner. points= verilirse örnekler LTTB ile mesafe-hız eğrisinin
+# şekli korunarak seyreltilir; seçilen indeksler tüm kanallara uygulanır. Çoklu sürücü
+# modunda her sürücünün turu ortak bir mesafe ızgarasına yeniden örneklenir.
+TELEMETRY_CHANNELS = {
+    "distance": "Distance",
+    "time": "Time",
+    "speed": "Speed",
+    "rpm": "RPM",
+    "gear": "nGear",
+    "throttle": "Throttle",
+    "brake": "Brake",
+    "drs": "DRS",
+    "x": "X",
+    "y": "Y",
+}
+TELEMETRY_INT_CHANNELS = ("rpm", "gear", "throttle", "drs")
+TELEMETRY_DECIMALS = {"distance": 1, "time": 3, "speed": 1, "x": 0, "y": 0}
+TELEMETRY_DEFAULT_POINTS = 500
+TELEMETRY_MAX_POINTS = 10000
+TELEMETRY_MAX_DRIVERS = 20
+
+def lttb_indices(x, y, threshold):
+    # Largest-Triangle-Three-Buckets: ilk ve son nokta korunur, aradaki her kovadan
+    # bir önceki seçilen nokta ve sonraki kovanın ortalamasıyla en büyük üçgeni
+    # kuran nokta seçilir. Kova ortalamaları tek seferde, alanlar kova başına vektörel.
+    n = len(x)
+    if threshold < 3 or threshold >= n:
+        return np.arange(n)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+    sizes = np.diff(edges)
+    avg_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1) / sizes
+    avg_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1) / sizes
+    next_x = np.append(avg_x[1:], x[n - 1])
+    next_y = np.append(avg_y[1:], y[n - 1])
+    selected = np.empty(threshold, dtype=int)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for k in range(threshold - 2):
+        lo, hi = edges[k], edges[k + 1]
+        area = np.abs((x[a] - next_x[k]) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (next_y[k] - y[a]))
+        a = lo + int(np.argmax(area))
+        selected[k + 1] = a
+    return selected
+
+def parse_telemetry_options(lap, points, channels, allow_raw=True):
+    if lap != "fastest" and not lap.isdigit():
+        raise HTTPException(status_code=400, detail="Tur numarası bir sayı ya da 'fastest' olmalı.")
+    if not ((allow_raw and points == 0) or 3 <= points <= TELEMETRY_MAX_POINTS):
+        raise HTTPException(status_code=400, detail=f"points 3 ile {TELEMETRY_MAX_POINTS} arasında olmalı.")
+    names = list(TELEMETRY_CHANNELS)
+    if channels:
+        names = [c.strip().lower() for c in channels.split(",") if c.strip()]
+        unknown = [c for c in names if c not in TELEMETRY_CHANNELS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Geçersiz kanal: {', '.join(unknown)}")
+    return names
+
+def _lap_telemetry(session, driver, lap):
+    laps = session.laps
+    laps = laps[(laps["Driver"] == driver) | (laps["DriverNumber"] == driver)]
+    if laps.empty:
+        return None, None
+    if lap == "fastest":
+        row = laps.pick_fastest()
+    else:
+        matching = laps[laps["LapNumber"] == int(lap)]
+        row = matching.iloc[0] if not matching.empty else None
+    if row is None:
+        return None, None
+    return int(row["LapNumber"]), row.get_telemetry()
+
+def telemetry_arrays(telemetry, names):
+    # Mesafe ve hız LTTB ve hizalama için her zaman alınır; eksik değerli satırlar atılır
+    names = list(dict.fromkeys(["distance", "speed", "time"] + names))
+    columns = {name: TELEMETRY_CHANNELS[name] for name in names if TELEMETRY_CHANNELS[name] in telemetry.columns}
+    frame = telemetry[list(columns.values())].dropna()
+    arrays = {}
+    for name, column in columns.items():
+        values = frame[column]
+        if pd.api.types.is_timedelta64_dtype(values):
+            values = values.dt.total_seconds()
+        arrays[name] = values.to_numpy(dtype=float)
+    return arrays
+
+def _channel_values(name, values):
+    if name == "brake":
+        return (values >= 0.5).tolist()
+    if name in TELEMETRY_INT_CHANNELS:
+        return np.rint(values).astype(int).tolist()
+    return np.round(values, TELEMETRY_DECIMALS.get(name, 2)).tolist()
+
+@app.get("/races/{season}/{round}/telemetry/{driver}/{lap}")
+@offload(load_executor)
+def get_lap_telemetry(season: int, round: int, driver: str, lap: str, points: int = TELEMETRY_DEFAULT_POINTS,
+                      channels: str = None):
+    try:
+        names = parse_telemetry_options(lap, points, channels)
+        driver = driver.upper()
+
+        def compute():
+            session = load_session(season, round, "R", "telemetry")
+            lap_number, telemetry = _lap_telemetry(session, driver, lap)
+            if telemetry is None or telemetry.empty:
+                return None
+            arrays = telemetry_arrays(telemetry, names)
+            samples = len(arrays["distance"])
+            with span("downsample"):
+                selected = lttb_indices(arrays["distance"], arrays["speed"], points) if points else np.arange(samples)
+            return {
+                "season": season,
+                "round": round,
+                "driver": driver,
+                "lap": lap_number,
+                "samples": samples,
+                "points": len(selected),
+                "channels": {name: _channel_values(name, arrays[name][selected]) for name in names if name in arrays}
+            }
+        params = {"driver": driver, "lap": lap, "points": points, "channels": names}
+        payload = payload_cache.get_or_compute(
+            "telemetry", season, round, params, compute, payload_settled(season, round)
+        )
+        if payload is None:
+            raise HTTPException(status_code=404, detail="Telemetri verisi bulunamadı.")
+        return payload
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/races/{season}/{round}/telemetry")
+@offload(load_executor)
+def get_telemetry_overlay(season: int, round: int, drivers: str, lap: str = "fastest",
+                          points: int = TELEMETRY_DEFAULT_POINTS, channels: str = None):
+    try:
+        names = [n for n in parse_telemetry_options(lap, points, channels, allow_raw=False) if n != "distance"]
+        requested = list(dict.fromkeys(d.strip().upper() for d in drivers.split(",") if d.strip()))
+        if not requested or len(requested) > TELEMETRY_MAX_DRIVERS:
+            raise HTTPException(status_code=400, detail=f"1 ile {TELEMETRY_MAX_DRIVERS} arasında sürücü seçilmeli.")
+
+        def compute():
+            session = load_session(season, round, "R", "telemetry")
+            laps = {}
+            for driver in requested:
+                lap_number, telemetry = _lap_telemetry(session, driver, lap)
+                if telemetry is not None and not telemetry.empty:
+                    arrays = telemetry_arrays(telemetry, names)
+                    if len(arrays["distance"]) > 1:
+                        laps[driver] = (lap_number, arrays)
+            if not laps:
+                return None
+            with span("downsample"):
+                # Ortak ızgara en kısa tur mesafesine kadar uzanır
+                length = min(arrays["distance"][-1] for _, arrays in laps.values())
+                grid = np.linspace(0.0, length, points)
+                reference = next(iter(laps))
+                reference_time = np.interp(grid, laps[reference][1]["distance"], laps[reference][1]["time"])
+                overlay = {}
+                for driver, (lap_number, arrays) in laps.items():
+                    resampled = {name: np.interp(grid, arrays["distance"], arrays[name]) for name in names if name in arrays}
+                    entry = {"lap": lap_number}
+                    entry.update({name: _channel_values(name, values) for name, values in resampled.items()})
+                    time_at = resampled["time"] if "time" in resampled else np.interp(grid, arrays["distance"], arrays["time"])
+                    entry["delta"] = np.round(time_at - reference_time, 3).tolist()
+                    overlay[driver] = entry
+            return {
+                "season": season,
+                "round": round,
+                "lap": lap,
+                "reference": reference,
+                "distance": _channel_values("distance", grid),
+                "drivers": overlay,
+                "missing_drivers": [d for d in requested if d not in laps]
+            }
+        params = {"drivers": requested, "lap": lap, "points": points, "channels": names}
+        payload = payload_cache.get_or_compute(
+            "telemetry_overlay", season, round, params, compute, payload_settled(season, round)
+        )
+        if payload is None:
+            raise HTTPException(status_code=404, detail="Telemetri verisi bulunamadı.")
+        return payload
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Yarış tekrarı: yarış kontrol mesajları, tur tamamlamaları ve sıra değişiklikleri
+# oturum zamanına göre tek bir zaman çizelgesinde birleştirilir ve olaylar tek tek
+# SSE (/replay) veya WebSocket (/replay/ws) üzerinden itilir. Zaman çizelgesi
+# önbellekteki oturumdan bir kez kurulur; olaylar önceden JSON'a çevrilmiş tutulur.
+# speed: oynatma hızı çarpanı (0 = beklemeden), start: ilk olaydan itibaren saniye.
+REPLAY_CACHE_ENTRIES = int(os.environ.get("REPLAY_CACHE_ENTRIES", "8"))
+REPLAY_MAX_SPEED = 3600.0
+REPLAY_HEARTBEAT = 15.0
+REPLAY_EVENT_TYPES = ("message", "lap", "position")
+REPLAY_LAP_FIELDS = [
+    ("driver", "Driver", "raw"),
+    ("lap_number", "LapNumber", "int"),
+    ("lap_time", "LapTime", "str"),
+    ("position", "Position", "int", None),
+]
+REPLAY_MESSAGE_FIELDS = EVENT_FIELDS[1:] + [
+    ("flag", "Flag", "raw", None),
+    ("scope", "Scope", "raw", None),
+    ("lap", "Lap", "int", None),
+]
+
+class ReplayTimeline:
+    def __init__(self, times, kinds, payloads):
+        order = np.argsort(times, kind="stable")
+        times = np.asarray(times, dtype=float)[order]
+        self.start = float(times[0]) if len(times) else 0.0
+        self.offsets = times - self.start
+        self.kinds = [kinds[i] for i in order]
+        self.payloads = [payloads[i] for i in order]
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def seek(self, offset):
+        return int(np.searchsorted(self.offsets, offset, side="left"))
+
+    def event(self, i):
+        # Olay gövdesi: tür, ilk olaydan itibaren saniye ve önceden serileştirilmiş veri
+        return f'{{"type": "{self.kinds[i]}", "t": {self.offsets[i]:.3f}, "data": {self.payloads[i]}}}'
+
+def _replay_laps(laps):
+    laps = laps[laps["Time"].notna()]
+    times = laps["Time"].dt.total_seconds().tolist()
+    payloads = [json.dumps(row, ensure_ascii=False) for row in serialize_frame(laps, REPLAY_LAP_FIELDS)]
+    # Sıra değişiklikleri: sürücünün bir önceki turdaki sırasından farklıysa
+    ordered = laps.sort_values(["Driver", "LapNumber"])
+    previous = ordered.groupby("Driver")["Position"].shift()
+    changed = ordered[previous.notna() & ordered["Position"].notna() & (previous != ordered["Position"])]
+    previous = previous[changed.index]
+    positions = [
+        json.dumps({"driver": driver, "lap_number": int(lap), "from": int(old), "to": int(new)}, ensure_ascii=False)
+        for driver, lap, old, new in zip(changed["Driver"], changed["LapNumber"], previous, changed["Position"])
+    ]
+    return times, payloads, changed["Time"].dt.total_seconds().tolist(), positions
+
+def _replay_messages(session, messages):
+    column = "Time" if "Time" in messages.columns else "UTC"
+    stamps = pd.to_datetime(messages[column])
+    t0 = session.t0_date
+    if t0 is None or pd.isna(t0):
+        return [], []
+    keep = stamps.notna()
+    times = ((stamps[keep] - pd.Timestamp(t0)).dt.total_seconds()).tolist()
+    payloads = [json.dumps(row, ensure_ascii=False) for row in serialize_frame(messages[keep], REPLAY_MESSAGE_FIELDS)]
+    return times, payloads
+
+def build_replay_timeline(season, round):
+    session = load_session(season, round, "R", "replay")
+    times, kinds, payloads = [], [], []
+    laps = session.laps
+    if laps is not None and not laps.empty:
+        lap_times, lap_payloads, position_times, position_payloads = _replay_laps(laps)
+        times += lap_times + position_times
+        kinds += ["lap"] * len(lap_times) + ["position"] * len(position_times)
+        payloads += lap_payloads + position_payloads
+    messages = session.race_control_messages
+    if messages is not None and not messages.empty:
+        message_times, message_payloads = _replay_messages(session, messages)
+        times += message_times
+        kinds += ["message"] * len(message_times)
+        payloads += message_payloads
+    return ReplayTimeline(times, kinds, payloads)
+
+class ReplayStore:
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, season, round):
+        key = (season, round)
+        with self._lock:
+            timeline = self._entries.get(key)
+            if timeline is not None:
+                self._entries.move_to_end(key)
+                return timeline
+        timeline = build_replay_timeline(season, round)
+        with self._lock:
+            self._entries[key] = timeline
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return timeline
+
+replay_store = ReplayStore(REPLAY_CACHE_ENTRIES)
+
+def parse_replay_options(speed, start, types):
+    if not (speed == 0 or 0 < speed <= REPLAY_MAX_SPEED):
+        raise HTTPException(status_code=400, detail=f"speed 0 ile {REPLAY_MAX_SPEED:g} arasında olmalı.")
+    if start < 0:
+        raise HTTPException(status_code=400, detail="start negatif olamaz.")
+    kinds = set(REPLAY_EVENT_TYPES)
+    if types:
+        kinds = {t.strip() for t in types.split(",") if t.strip()}
+        unknown = kinds - set(REPLAY_EVENT_TYPES)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Geçersiz olay türü: {', '.join(sorted(unknown))}")
+    return kinds
+
+async def load_replay(season, round):
+    timeline = await load_executor.run(replay_store.get, season, round)
+    if len(timeline) == 0:
+        raise HTTPException(status_code=404, detail="Tekrar verisi bulunamadı.")
+    return timeline
+
+async def _replay_sse(timeline, index, speed, kinds):
+    origin = time.monotonic()
+    base = timeline.offsets[index] if index < len(timeline) else 0.0
+    # Zamanı gelmiş olaylar tek parça halinde gönderilir; beklemeden önce tampon boşaltılır
+    pending = [f": replay {len(timeline)} events\n\n"]
+    for i in range(index, len(timeline)):
+        if timeline.kinds[i] not in kinds:
+            continue
+        if speed:
+            delay = origin + (timeline.offsets[i] - base) / speed - time.monotonic()
+            if delay > 0 and pending:
+                yield "".join(pending)
+                pending = []
+            while delay > REPLAY_HEARTBEAT:
+                await asyncio.sleep(REPLAY_HEARTBEAT)
+                yield ": keepalive\n\n"
+                delay -= REPLAY_HEARTBEAT
+            if delay > 0:
+                await asyncio.sleep(delay)
+        pending.append(f"id: {i}\nevent: {timeline.kinds[i]}\ndata: {timeline.event(i)}\n\n")
+    pending.append('event: end\ndata: {"type": "end"}\n\n')
+    yield "".join(pending)
+
+@app.get("/races/{season}/{round}/replay")
+async def replay_race_sse(season: int, round: int, speed: float = 1.0, start: float = 0.0, types: str = None,
+                          last_event_id: str = Header(None)):
+    try:
+        kinds = parse_replay_options(speed, start, types)
+        timeline = await load_replay(season, round)
+        index = timeline.seek(start)
+        if last_event_id is not None and last_event_id.isdigit():
+            # Bağlantısı kopan istemci son aldığı olaydan devam eder
+            index = int(last_event_id) + 1
+        return StreamingResponse(
+            _replay_sse(timeline, index, speed, kinds),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.websocket("/races/{season}/{round}/replay/ws")
+async def replay_race_ws(websocket: WebSocket, season: int, round: int, speed: float = 1.0, start: float = 0.0,
+                         types: str = None):
+    # İstemci {"seek": saniye}, {"speed": çarpan} ve {"types": "lap,message"} komutları gönderebilir
+    await websocket.accept()
+    try:
+        kinds = parse_replay_options(speed, start, types)
+        timeline = await load_replay(season, round)
+    except HTTPException as e:
+        await websocket.send_json({"type": "error", "detail": e.detail})
+        await websocket.close(code=1008)
+        return
+    except Exception as e:
+        await websocket.send_json({"type": "error", "detail": str(e)})
+        await websocket.close(code=1011)
+        return
+    index = timeline.seek(start)
+    origin, base = time.monotonic(), start
+    ended = False
+    receive = asyncio.ensure_future(websocket.receive_text())
+    try:
+        while True:
+            while index < len(timeline) and timeline.kinds[index] not in kinds:
+                index += 1
+            if index >= len(timeline):
+                if not ended:
+                    # Sona gelindi; bağlantı açık kalır, istemci geri sarabilir
+                    await websocket.send_json({"type": "end"})
+                    ended = True
+                delay = None
+            elif speed:
+                delay = max(origin + (timeline.offsets[index] - base) / speed - time.monotonic(), 0.0)
+            else:
+                delay = 0.0
+            if delay != 0.0 or receive.done():
+                # Sıradaki olayı beklerken gelen komutlar bekleyişi keser
+                done, _ = await asyncio.wait({receive}, timeout=delay)
+                if receive in done:
+                    text = receive.result()
+                    receive = asyncio.ensure_future(websocket.receive_text())
+                    try:
+                        # Geçersiz JSON (JSONDecodeError, bir ValueError) bağlantıyı kapatmaz
+                        command = json.loads(text)
+                        if not isinstance(command, dict):
+                            raise ValueError("Komut bir JSON nesnesi olmalı.")
+                        if "speed" in command or "types" in command:
+                            new_speed = float(command.get("speed", speed))
+                            new_kinds = parse_replay_options(new_speed, 0.0, command.get("types"))
+                            if "types" in command:
+                                # Yalnızca hız değişiyorsa mevcut olay türü süzgeci korunur
+                                kinds = new_kinds
+                            base = timeline.offsets[index] if index < len(timeline) else base
+                            speed, origin = new_speed, time.monotonic()
+                        if "seek" in command:
+                            base = float(command["seek"])
+                            parse_replay_options(speed, base, None)
+                            index, origin = timeline.seek(base), time.monotonic()
+                            ended = False
+                        await websocket.send_json({"type": "ack", "command": command})
+                    except (HTTPException, TypeError, ValueError) as e:
+                        await websocket.send_json({"type": "error", "detail": getattr(e, "detail", str(e))})
+                    continue
+                if delay is None:
+                    continue
+            await websocket.send_text(timeline.event(index))
+            index += 1
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receive.cancel()
+
+# Sezon puan durumu motoru: her turun (Race/Sprint) puanları bir kez hesaplanır
+# ve saklanır. Sürücü ve takım sıralamaları bu kayıtların projeksiyonudur.
+STANDINGS_SETTLE_DAYS = 3
+STANDINGS_SESSIONS = {
+    "Race": ("R", F1_POINTS),
+    "Sprint": ("S", SPRINT_POINTS),
+}
+
+class StandingsEngine:
+    def __init__(self):
+        self._rounds = {}
+        self._lock = threading.Lock()
+
+    def round_points(self, season, round_number, kind, event_date):
+        key = (season, round_number, kind)
+        with self._lock:
+            if key in self._rounds:
+                return self._rounds[key]
+        event_date = pd.Timestamp(event_date)
+        now = pd.Timestamp.now()
+        if pd.notna(event_date) and event_date > now:
+            # Henüz yapılmamış yarış için oturum yüklenmez
+            return None
+        settled = pd.isna(event_date) or now - event_date > pd.Timedelta(days=STANDINGS_SETTLE_DAYS)
+        try:
+            entries = payload_cache.get_or_compute(
+                "round_points", season, round_number, {"kind": kind},
+                lambda: self._compute(season, round_number, kind), settled
+            )
+        except Exception as e:
+            # Geçici yükleme hatası saklanmaz; tur bu istekte eksik görünür, sonra yeniden denenir
+            LOAD_FAILURES.inc(kind, type(e).__name__)
+            mark_partial()
+            return None
+        if settled:
+            # Yalnızca kesinleşmiş turlar saklanır; STANDINGS_SETTLE_DAYS dolana kadar
+            # yarış sonrası cezalar değişebileceği için tur her istekte yeniden hesaplanır
+            with self._lock:
+                self._rounds[key] = entries
+        return entries
+
+    def _compute(self, season, round_number, kind):
+        code, points_table = STANDINGS_SESSIONS[kind]
+        session = load_session(season, round_number, code)
+        results = session.results
+        if results is None:
+            return None
+        fastest_lap_driver = None
+        if kind == "Race":
+            # En hızlı turu bul
+            if "FastestLap" in results.columns and not results["FastestLap"].isnull().all():
+                fastest_lap_row = results.loc[results["FastestLapTime"] == results["FastestLapTime"].min()]
+                if not fastest_lap_row.empty:
+                    fastest_lap_driver = fastest_lap_row.iloc[0]["DriverNumber"]
+        entries = []
+        points_log = []
+        for _, r in results.iterrows():
+            pos = int(r["Position"])
+            driver_id = r["DriverNumber"]
+            pts = 0
+            if pos <= len(points_table):
+                pts = points_table[pos-1]
+            # En hızlı tur puanı (ilk 10'da ve fastest lap sahibi)
+            if fastest_lap_driver == driver_id and pos <= 10:
+                pts += 1
+            if pts > 0:
+                entries.append({"driver_id": driver_id, "name": r["FullName"], "team": r["TeamName"], "points": pts})
+                points_log.append((r["FullName"], pos, pts))
+        logger.debug("%s Round %s (%s) puan dağılımı: %s", season, round_number, kind, points_log)
+        return entries
+
+    def _weekend(self, season, round_number, event_date, sprint):
+        weekend = []
+        for kind in STANDINGS_SESSIONS:
+            if kind == "Sprint" and not sprint:
+                # Sprintsiz hafta sonunda oturum yüklenmez; tur yine veri yok olarak listelenir
+                weekend.append((kind, None))
                 continue
-            round_number = int(row["RoundNumber"])
-            # Ana yarış (Race)
-            try:
-                session = fastf1.get_session(season, round_number, "R")
-                session.load()
-                results = session.results
-                fastest_lap_driver = None
-                if results is not None:
-                    # En hızlı turu bul
-                    if "FastestLap" in results.columns and not results["FastestLap"].isnull().all():
-                        fastest_lap_row = results.loc[results["FastestLapTime"] == results["FastestLapTime"].min()]
-                        if not fastest_lap_row.empty:
-                            fastest_lap_driver = fastest_lap_row.iloc[0]["DriverNumber"]
-                    race_points_log = []
-                    for idx, r in results.iterrows():
-                        pos = int(r["Position"])
-                        driver_id = r["DriverNumber"]
-                        name = r["FullName"]
-                        pts = 0
-                        if pos <= 10:
-                            pts = F1_POINTS[pos-1]
-                        # En hızlı tur puanı (ilk 10'da ve fastest lap sahibi)
-                        if fastest_lap_driver == driver_id and pos <= 10:
-                            pts += 1
-                        if pts > 0:
-                            driver_points[driver_id] = driver_points.get(driver_id, 0) + pts
-                            driver_names[driver_id] = name
-                            race_points_log.append((name, pos, pts))
-                    print(f"{season} Round {round_number} (Race) puan dağılımı: {race_points_log}")
-                else:
-                    no_data_rounds.append(f"Race-{round_number}")
-            except Exception as e:
+            entries = self.round_points(season, round_number, kind, event_date)
+            weekend.append((kind, entries))
+            if entries is None:
+                # Ana yarış verisi yoksa sprint de denenmez
+                break
+        return weekend
+
+    def season_rounds(self, season):
+        weekends = [(e["round"], e["date"], has_sprint(e)) for e in schedule_service.get(season).weekends()]
+        rounds = []
+        no_data_rounds = []
+        outcomes = fan_out(lambda w: self._weekend(season, *w), weekends)
+        for (round_number, _, _), (weekend, error) in zip(weekends, outcomes):
+            if error is not None:
                 no_data_rounds.append(f"Race-{round_number}")
+                LOAD_FAILURES.inc("Race", type(error).__name__)
+                mark_partial()
                 continue
-            # Sprint
-            try:
-                session = fastf1.get_session(season, round_number, "S")
-                session.load()
-                results = session.results
-                if results is not None:
-                    sprint_points_log = []
-                    for idx, r in results.iterrows():
-                        pos = int(r["Position"])
-                        driver_id = r["DriverNumber"]
-                        name = r["FullName"]
-                        pts = 0
-                        if pos <= 8:
-                            pts = SPRINT_POINTS[pos-1]
-                        if pts > 0:
-                            driver_points[driver_id] = driver_points.get(driver_id, 0) + pts
-                            driver_names[driver_id] = name
-                            sprint_points_log.append((name, pos, pts))
-                    print(f"{season} Round {round_number} (Sprint) puan dağılımı: {sprint_points_log}")
+            for kind, entries in weekend:
+                if entries is None:
+                    no_data_rounds.append(f"{kind}-{round_number}")
                 else:
-                    no_data_rounds.append(f"Sprint-{round_number}")
-            except Exception as e:
-                no_data_rounds.append(f"Sprint-{round_number}")
-                continue
+                    rounds.append((kind, round_number, entries))
+        return rounds, no_data_rounds
+
+    def warm(self, season, before_round):
+        # Ön yükleme için: turlar ortak fan-out havuzu yerine çağıran iş parçacığında
+        # sırayla hesaplanır; before_round her turdan önce çağrılır
+        for e in schedule_service.get(season).weekends():
+            before_round()
+            self._weekend(season, e["round"], e["date"], has_sprint(e))
+
+    def driver_standings(self, season):
+        rounds, no_data_rounds = self.season_rounds(season)
+        driver_points = {}
+        driver_names = {}
+        for _, _, entries in rounds:
+            for e in entries:
+                driver_points[e["driver_id"]] = driver_points.get(e["driver_id"], 0) + e["points"]
+                driver_names[e["driver_id"]] = e["name"]
         standings = [
             {"driver_id": driver_id, "name": driver_names[driver_id], "points": pts}
             for driver_id, pts in driver_points.items()
         ]
         standings.sort(key=lambda x: x["points"], reverse=True)
+        return standings, no_data_rounds
+
+    def constructor_standings(self, season):
+        rounds, no_data_rounds = self.season_rounds(season)
+        team_points = {}
+        for _, _, entries in rounds:
+            for e in entries:
+                team_points[e["team"]] = team_points.get(e["team"], 0) + e["points"]
+        standings = [
+            {"team": team, "points": pts}
+            for team, pts in team_points.items()
+        ]
+        standings.sort(key=lambda x: x["points"], reverse=True)
+        return standings, no_data_rounds
+
+    def progression(self, season, key):
+        # Tur x sürücü (veya takım) puan matrisi tek seferde kurulur; kümülatif toplam
+        # ve her turdan sonraki sıra sütun bazlı hesaplanır. Sprint ve yarış aynı tura yazılır.
+        rounds, no_data_rounds = self.season_rounds(season)
+        rows = [
+            (round_number, e[key], e["name"], e["points"])
+            for _, round_number, entries in rounds for e in entries
+        ]
+        if not rows:
+            return [], [], no_data_rounds
+        frame = pd.DataFrame(rows, columns=["round", "key", "name", "points"])
+        matrix = frame.pivot_table(index="round", columns="key", values="points", aggfunc="sum", fill_value=0)
+        matrix = matrix.reindex(sorted({r for _, r, _ in rounds}), fill_value=0).sort_index()
+        cumulative = matrix.cumsum()
+        ranks = cumulative.rank(axis=1, method="min", ascending=False).astype(int)
+        names = frame.groupby("key")["name"].last()
+        order = cumulative.iloc[-1].sort_values(ascending=False, kind="stable").index
+        series = [
+            {
+                key: k,
+                "name": names[k],
+                "round_points": matrix[k].astype(int).tolist(),
+                "points": cumulative[k].astype(int).tolist(),
+                "rank": ranks[k].tolist()
+            }
+            for k in order
+        ]
+        return matrix.index.astype(int).tolist(), series, no_data_rounds
+
+standings_engine = StandingsEngine()
+
+@app.get("/standings/drivers/{season}")
+@offload(load_executor)
+def get_driver_standings_local(season: int):
+    try:
+        standings, no_data_rounds = standings_engine.driver_standings(season)
         return {"season": season, "driver_standings": standings, "no_data_rounds": no_data_rounds}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/standings/constructors/{season}")
+@offload(load_executor)
 def get_constructor_standings_local(season: int):
     try:
-        schedule = fastf1.get_event_schedule(season)
-        team_points = {}
-        team_names = {}
-        no_data_rounds = []
-        for _, row in schedule.iterrows():
-            if row.get("EventFormat") not in ["conventional", "sprint"]:
-                continue
-            round_number = int(row["RoundNumber"])
-            # Ana yarış (Race)
-            try:
-                session = fastf1.get_session(season, round_number, "R")
-                session.load()
-                results = session.results
-                fastest_lap_driver = None
-                if results is not None:
-                    if "FastestLap" in results.columns and not results["FastestLap"].isnull().all():
-                        fastest_lap_row = results.loc[results["FastestLapTime"] == results["FastestLapTime"].min()]
-                        if not fastest_lap_row.empty:
-                            fastest_lap_driver = fastest_lap_row.iloc[0]["DriverNumber"]
-                    for idx, r in results.iterrows():
-                        pos = int(r["Position"])
-                        team = r["TeamName"]
-                        driver_id = r["DriverNumber"]
-                        pts = 0
-                        if pos <= 10:
-                            pts = F1_POINTS[pos-1]
-                        if fastest_lap_driver == driver_id and pos <= 10:
-                            pts += 1
-                        if pts > 0:
-                            team_points[team] = team_points.get(team, 0) + pts
-                            team_names[team] = team
-                else:
-                    no_data_rounds.append(f"Race-{round_number}")
-            except Exception as e:
-                no_data_rounds.append(f"Race-{round_number}")
+        standings, no_data_rounds = standings_engine.constructor_standings(season)
+        return {"season": season, "constructor_standings": standings, "no_data_rounds": no_data_rounds}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/standings/drivers/{season}/progression")
+@offload(load_executor)
+def get_driver_standings_progression(season: int):
+    try:
+        rounds, drivers, no_data_rounds = standings_engine.progression(season, "driver_id")
+        return {"season": season, "rounds": rounds, "drivers": drivers, "no_data_rounds": no_data_rounds}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/standings/constructors/{season}/progression")
+@offload(load_executor)
+def get_constructor_standings_progression(season: int):
+    try:
+        rounds, teams, no_data_rounds = standings_engine.progression(season, "team")
+        for team in teams:
+            # Takım serisinde sürücü adı anlamsız; anahtar zaten takım adı
+            del team["name"]
+        return {"season": season, "rounds": rounds, "constructors": teams, "no_data_rounds": no_data_rounds}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Çok sezonluk kariyer sorguları: ingest.py'nin yazdığı bölümlenmiş Parquet deposu
+# (DATA_STORE_DIR) pyarrow.dataset ile bir kez okunup bellekte tutulur; süzme ve
+# sezon bazlı toplamalar pyarrow.compute ile sütunlar üzerinde yapılır, oturum
+# yüklenmez. ingest.py yazımı bitirince _version dosyasını günceller, tablolar
+# bir sonraki sorguda yeniden okunur.
+DATA_STORE_DIR = os.environ.get("DATA_STORE_DIR", os.path.join("cache", "store"))
+CAREER_SESSIONS = {"race": "results", "sprint": "sprints"}
+CAREER_RESULT_COLUMNS = ("season", "round", "team", "grid", "position", "status", "points")
+CAREER_KEY_COLUMNS = ("season", "round", "abbreviation", "driver_number", "driver_id", "team")
+
+@functools.lru_cache(maxsize=None)
+def _arrow_modules():
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    return pa, pc, ds
+
+def arrow():
+    try:
+        return _arrow_modules()
+    except ImportError:
+        raise HTTPException(status_code=503, detail="Kariyer sorguları için sunucuda pyarrow kurulu değil.")
+
+class ColumnarStore:
+    def __init__(self, directory=DATA_STORE_DIR):
+        self.directory = directory
+        self._tables = {}
+        self._version = None
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def _current_version(self):
+        try:
+            return os.stat(os.path.join(self.directory, "_version")).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def table(self, name):
+        # Tablo depoda yoksa (ör. hiç sprint yazılmamışsa) None döner
+        version = self._current_version()
+        if version is None:
+            raise HTTPException(status_code=404, detail="Veri deposu bulunamadı, önce ingest.py çalıştırılmalı.")
+        pa, _, ds = arrow()
+        with self._lock:
+            if version != self._version:
+                self._tables.clear()
+                self._version = version
+            if name not in self._tables:
+                path = os.path.join(self.directory, name)
+                table = None
+                if os.path.isdir(path):
+                    with span("store_load"):
+                        # Bölüm başına bir parça yerine tek parça: süzme çekirdekleri parça sayısıyla yavaşlar
+                        table = ds.dataset(path, format="parquet", partitioning="hive").to_table().combine_chunks()
+                    self.loads += 1
+                self._tables[name] = table
+            return self._tables[name]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "directory": self.directory,
+                "tables": {
+                    name: table.num_rows if table is not None else None
+                    for name, table in self._tables.items()
+                },
+                "loads": self.loads
+            }
+
+columnar_store = ColumnarStore()
+
+def parse_seasons(seasons):
+    # "2021-2023,2025" -> [2021, 2022, 2023, 2025]; boşsa depodaki tüm sezonlar
+    if not seasons:
+        return None
+    selected = set()
+    try:
+        for part in seasons.split(","):
+            part = part.strip()
+            if not part:
                 continue
-            # Sprint
-            try:
-                session = fastf1.get_session(season, round_number, "S")
-                session.load()
-                results = session.results
-                if results is not None:
-                    for idx, r in results.iterrows():
-                        pos = int(r["Position"])
-                        team = r["TeamName"]
-                        pts = 0
-                        if pos <= 8:
-                            pts = SPRINT_POINTS[pos-1]
-                        if pts > 0:
-                            team_points[team] = team_points.get(team, 0) + pts
-                            team_names[team] = team
-                else:
-                    no_data_rounds.append(f"Sprint-{round_number}")
-            except Exception as e:
-                no_data_rounds.append(f"Sprint-{round_number}")
+            start, _, end = part.partition("-")
+            start = int(start)
+            end = int(end) if end else start
+            if end < start or end - start > 100:
+                raise ValueError(part)
+            selected.update(range(start, end + 1))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="seasons '2021-2023,2025' biçiminde olmalı.")
+    return sorted(selected)
+
+def _identity_mask(table, kind, value):
+    pa, pc, _ = arrow()
+    if kind == "team":
+        return pc.equal(pc.utf8_lower(table["team"]), value.lower())
+    mask = pc.or_(pc.equal(table["abbreviation"], value.upper()), pc.equal(table["driver_number"], value))
+    if "driver_id" in table.column_names:
+        mask = pc.or_(mask, pc.equal(table["driver_id"], value.lower()))
+    return mask
+
+def store_rows(name, kind, value, seasons, columns=None):
+    table = columnar_store.table(name)
+    if table is None:
+        return None
+    pa, pc, _ = arrow()
+    if columns is not None:
+        # Süzme yalnızca sorgunun kullandığı sütunları kopyalar
+        table = table.select([c for c in table.column_names if c in columns or c in CAREER_KEY_COLUMNS])
+    mask = _identity_mask(table, kind, value)
+    if seasons is not None:
+        season_type = table.schema.field("season").type
+        mask = pc.and_(mask, pc.is_in(table["season"], value_set=pa.array(seasons, type=season_type)))
+    return table.filter(pc.fill_null(mask, False))
+
+def _per_season(rows, columns):
+    # columns: {ad: (dizi, toplama)} -> {sezon: {ad: değer}}
+    if rows is None or rows.num_rows == 0:
+        return {}
+    pa, _, _ = arrow()
+    table = pa.table({"season": rows["season"], **{name: values for name, (values, _) in columns.items()}})
+    grouped = table.group_by("season").aggregate([(name, fn) for name, (_, fn) in columns.items()])
+    by_season = {}
+    for row in grouped.to_pylist():
+        by_season[row["season"]] = {name: row[f"{name}_{fn}"] for name, (_, fn) in columns.items()}
+    return by_season
+
+def _career_line(values):
+    classified = values.get("classified", 0)
+    return {
+        "races": values.get("races", 0),
+        "wins": values.get("wins", 0),
+        "podiums": values.get("podiums", 0),
+        "poles": values.get("poles", 0),
+        "points": float(values.get("points") or 0) + float(values.get("sprint_points") or 0),
+        "sprint_wins": values.get("sprint_wins", 0),
+        "dnfs": values.get("dnfs", 0),
+        "laps_led": values.get("laps_led", 0),
+        "best_finish": values.get("best_finish"),
+        "average_finish": round(values["position_sum"] / classified, 2) if classified else None
+    }
+
+def career_stats(kind, value, seasons):
+    _, pc, _ = arrow()
+    results = store_rows("results", kind, value, seasons)
+    if results is None or results.num_rows == 0:
+        raise HTTPException(status_code=404, detail="Depoda bu sürücü/takım için sonuç bulunamadı.")
+    position = results["position"]
+    merged = _per_season(results, {
+        "races": (results["round"], "count_distinct"),
+        "wins": (pc.equal(position, 1), "sum"),
+        "podiums": (pc.less_equal(position, 3), "sum"),
+        "points": (results["points"], "sum"),
+        "dnfs": (pc.invert(results["finished"]), "sum"),
+        "best_finish": (position, "min"),
+        "position_sum": (position, "sum"),
+        "classified": (position, "count")
+    })
+    extras = (
+        ("qualifying", ("position",), lambda rows: {"poles": (pc.equal(rows["position"], 1), "sum")}),
+        ("sprints", ("position", "points"), lambda rows: {
+            "sprint_wins": (pc.equal(rows["position"], 1), "sum"),
+            "sprint_points": (rows["points"], "sum")
+        }),
+        ("laps", ("position",), lambda rows: {"laps_led": (pc.equal(rows["position"], 1), "sum")}),
+    )
+    for name, used, columns in extras:
+        rows = store_rows(name, kind, value, seasons, used)
+        if rows is None or rows.num_rows == 0:
+            continue
+        for season, values in _per_season(rows, columns(rows)).items():
+            merged.setdefault(season, {}).update(values)
+    per_season = [{"season": season, **_career_line(merged[season])} for season in sorted(merged)]
+    totals = {}
+    for values in merged.values():
+        for name, number in values.items():
+            if number is None:
                 continue
-        standings = [
-            {"team": team, "points": pts}
-            for team, pts in team_points.items()
-        ]
-        standings.sort(key=lambda x: x["points"], reverse=True)
-        return {"season": season, "constructor_standings": standings, "no_data_rounds": no_data_rounds}
+            if name == "best_finish":
+                totals[name] = min(totals.get(name, number), number)
+            else:
+                totals[name] = totals.get(name, 0) + number
+    missing = [s for s in seasons if s not in merged] if seasons is not None else []
+    return results, per_season, _career_line(totals), missing
+
+def _unique(values):
+    # Son sezondan geriye, ilk görülme sırasıyla benzersiz değerler
+    seen = []
+    for value in reversed(values.to_pylist()):
+        if value is not None and value not in seen:
+            seen.append(value)
+    return seen
+
+@app.get("/career/drivers/{driver}")
+@offload(load_executor)
+def get_driver_career(driver: str, seasons: str = None):
+    try:
+        results, per_season, totals, missing = career_stats("driver", driver, parse_seasons(seasons))
+        results = results.sort_by([("season", "ascending"), ("round", "ascending")])
+        last = results.slice(results.num_rows - 1).to_pylist()[0]
+        return {
+            "driver": {
+                "driver_id": last.get("driver_id"),
+                "abbreviation": last["abbreviation"],
+                "number": last["driver_number"],
+                "name": last["driver"],
+                "teams": _unique(results["team"])
+            },
+            "totals": totals,
+            "seasons": per_season,
+            "missing_seasons": missing
+        }
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/career/teams/{team}")
+@offload(load_executor)
+def get_team_career(team: str, seasons: str = None):
+    try:
+        results, per_season, totals, missing = career_stats("team", team, parse_seasons(seasons))
+        results = results.sort_by([("season", "ascending"), ("round", "ascending")])
+        return {
+            "team": results["team"][results.num_rows - 1].as_py(),
+            "drivers": _unique(results["driver"]),
+            "totals": totals,
+            "seasons": per_season,
+            "missing_seasons": missing
+        }
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/career/drivers/{driver}/results")
+@offload(load_executor)
+def get_driver_career_results(driver: str, seasons: str = None, session: str = "race", position_max: int = None):
+    try:
+        if session not in CAREER_SESSIONS:
+            raise HTTPException(status_code=400, detail="session 'race' ya da 'sprint' olmalı.")
+        _, pc, _ = arrow()
+        rows = store_rows(CAREER_SESSIONS[session], "driver", driver, parse_seasons(seasons), CAREER_RESULT_COLUMNS)
+        if rows is None or rows.num_rows == 0:
+            raise HTTPException(status_code=404, detail="Depoda bu sürücü için sonuç bulunamadı.")
+        if position_max is not None:
+            rows = rows.filter(pc.fill_null(pc.less_equal(rows["position"], position_max), False))
+        rows = rows.sort_by([("season", "ascending"), ("round", "ascending")])
+        events = {}
+        schedules = columnar_store.table("schedules")
+        if schedules is not None:
+            for event in schedules.select(["season", "round", "name"]).to_pylist():
+                events[(event["season"], event["round"])] = event["name"]
+        results = rows.select(list(CAREER_RESULT_COLUMNS)).to_pylist()
+        for result in results:
+            result["event"] = events.get((result["season"], result["round"]))
+        return {"driver": driver, "session": session, "results": results}
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Pist haritaları: koordinatlar ve çizilmiş çıktılar önce bellekte (LRU), sonra
+# diskte tutulur. Çizim pyplot'un global durumunu kullanmaz; her istek kendi
+# Figure/Agg tuvalini oluşturduğu için eşzamanlı isteklerde güvenlidir.
+TRACK_MAP_CACHE_DIR = os.environ.get("TRACK_MAP_CACHE_DIR", os.path.join("cache", "track_maps"))
+TRACK_MAP_CACHE_ENTRIES = int(os.environ.get("TRACK_MAP_CACHE_ENTRIES", "256"))
+TRACK_MAP_DPI = 100
+TRACK_MAP_FORMATS = {"png": "image/png", "svg": "image/svg+xml", "json": "application/json"}
+
+class TrackMapCache:
+    def __init__(self, directory, max_entries):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, "_".join(str(k) for k in key))
+
+    def get(self, key):
+        data = self.peek(key)
+        return data if data is not None else self.read(key)
+
+    def peek(self, key):
+        # Yalnızca bellek; olay döngüsünden güvenle çağrılabilir
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return data
+
+    def read(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        self._remember(key, data)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            # Disk yazılamıyorsa yalnızca bellek önbelleği kullanılır
+            pass
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses
+            }
+
+track_map_cache = TrackMapCache(TRACK_MAP_CACHE_DIR, TRACK_MAP_CACHE_ENTRIES)
+
+def _rotate(xy, angle):
+    rad = np.deg2rad(angle)
+    rotation = np.array([[np.cos(rad), np.sin(rad)], [-np.sin(rad), np.cos(rad)]])
+    return np.matmul(xy, rotation)
+
+def _track_coordinates(season, round, load=load_session):
+    key = ("coords", season, round)
+    cached = track_map_cache.get(key)
+    if cached is not None:
+        return np.load(io.BytesIO(cached))
+    session = load(season, round, "R", "telemetry")
+    circuit_info = session.get_circuit_info()
+    coords = getattr(circuit_info, "coordinates", None)
+    if coords is None:
+        # En hızlı turun konum verisi, resmi harita yönüne döndürülerek kullanılır
+        lap = session.laps.pick_fastest()
+        if lap is None:
+            return None
+        pos = lap.get_pos_data()
+        coords = _rotate(pos[["X", "Y"]].to_numpy(dtype=float), circuit_info.rotation)
+    coords = np.asarray(coords, dtype=float)
+    buf = io.BytesIO()
+    np.save(buf, coords)
+    track_map_cache.put(key, buf.getvalue())
+    return coords
+
+def _render_track_png(coords, width, height):
+    with span("render"):
+        return _draw_track_png(coords, width, height)
+
+def _draw_track_png(coords, width, height):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=(width / TRACK_MAP_DPI, height / TRACK_MAP_DPI), dpi=TRACK_MAP_DPI)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.plot(coords[:, 0], coords[:, 1], color='black')
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', bbox_inches='tight', pad_inches=0)
+    return buf.getvalue()
+
+def _render_track_svg(coords, width, height):
+    # Rasterleştirme yok: koordinatlar doğrudan bir SVG polyline'a ölçeklenir
+    mins = coords.min(axis=0)
+    extent = np.maximum(coords.max(axis=0) - mins, 1e-9)
+    padding = 0.02 * min(width, height)
+    scale = min((width - 2 * padding) / extent[0], (height - 2 * padding) / extent[1])
+    offset = (np.array([width, height]) - extent * scale) / 2
+    points = (coords - mins) * scale + offset
+    points[:, 1] = height - points[:, 1]
+    polyline = " ".join(f"{x:.1f},{y:.1f}" for x, y in points.tolist())
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {width} {height}">'
+        f'<polyline points="{polyline}" fill="none" stroke="black" stroke-width="2" '
+        f'stroke-linejoin="round"/></svg>'
+    ).encode()
+
+def _render_track_map(key, coords, season, round, format, width, height):
+    # JSON/SVG/PNG üretimi ve disk yazımı olay döngüsü dışında, render havuzunda yapılır
+    if format == "json":
+        with span("serialize"):
+            data = json.dumps({"season": season, "round": round, "coordinates": coords.tolist()}).encode()
+    elif format == "svg":
+        with span("render"):
+            data = _render_track_svg(coords, width, height)
+    else:
+        data = _render_track_png(coords, width, height)
+    track_map_cache.put(key, data)
+    return data
+
 @app.get("/track-map/{season}/{round}")
-def get_track_map(season: int, round: int):
+async def get_track_map(season: int, round: int, format: str = "png", width: int = 640, height: int = 480):
     try:
-        session = fastf1.get_session(season, round, "R")
-        session.load()
-        coords = session.get_circuit_info().coordinates
+        if format not in TRACK_MAP_FORMATS:
+            raise HTTPException(status_code=400, detail="Geçersiz format; png, svg veya json olmalı.")
+        if not (64 <= width <= 4096 and 64 <= height <= 4096):
+            raise HTTPException(status_code=400, detail="Genişlik ve yükseklik 64 ile 4096 arasında olmalı.")
+        media_type = TRACK_MAP_FORMATS[format]
+        key = ("map", season, round, f"{width}x{height}.{format}")
+        # Bellek isabeti doğrudan döner; yalnızca disk okuması render havuzuna gider
+        cached = track_map_cache.peek(key)
+        if cached is None:
+            cached = await render_executor.run(track_map_cache.read, key)
+        if cached is not None:
+            return Response(content=cached, media_type=media_type)
+        coords = await load_executor.run(_track_coordinates, season, round)
         if coords is None or len(coords) == 0:
             raise HTTPException(status_code=404, detail="Pist haritası bulunamadı.")
-
-        fig, ax = plt.subplots()
-        ax.plot(coords[:, 0], coords[:, 1], color='black')
-        ax.set_aspect('equal')
-        ax.axis('off')
-
-        buf = io.BytesIO()
-        plt.savefig(buf, format='png', bbox_inches='tight', pad_inches=0)
-        plt.close(fig)
-        buf.seek(0)
-        return Response(content=buf.read(), media_type="image/png")
+        data = await render_executor.run(_render_track_map, key, coords, season, round, format, width, height)
+        return Response(content=data, media_type=media_type)
+    except HTTPException as e:
+        raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _sprint_top8(results):
+    return serialize_frame(results[results["Position"] <= 8], SPRINT_FIELDS)
+
+def _load_sprint(season, round_number, event_name):
+    for sprint_code in ["S", "Sprint"]:
+        try:
+            logger.debug("Sprint round %s - %s: get_session(%s, %s, %r)", round_number, event_name, season, round_number, sprint_code)
+            session = load_session(season, round_number, sprint_code)
+            results = session.results
+            if results is not None:
+                return {
+                    "round": round_number,
+                    "event": event_name,
+                    "sprint_code": sprint_code,
+                    "sprint_results": _sprint_top8(results)
+                }
+        except Exception as e:
+            logger.debug("Sprint round %s (%s) yüklenemedi: %s", round_number, sprint_code, e)
+            continue
+    return None
+
+# Sabit yol, parametreli /sprints/{season} rotasından önce kaydedilmeli; yoksa
+# /sprints/2024 istekleri o rotaya düşer
+@app.get("/sprints/2024")
+@offload(load_executor)
+def get_2024_sprint_results():
+    season = 2024
+    all_sprints = []
+    def load(round_number):
+        results = load_session(season, round_number, "S").results
+        return _sprint_top8(results) if results is not None else []
+    rounds = list(SPRINT_ROUNDS_2024.items())
+    for (round_number, event_name), (sprint_results, error) in zip(rounds, fan_out(load, [r for r, _ in rounds])):
+        if error is not None:
+            mark_partial()
+            all_sprints.append({
+                "round": round_number,
+                "event": event_name,
+                "error": str(error)
+            })
+        else:
+            all_sprints.append({
+                "round": round_number,
+                "event": event_name,
+                "sprint_results": sprint_results
+            })
+    return {"season": season, "sprints": all_sprints}
+
 @app.get("/sprints/{season}")
+@offload(load_executor)
 def get_sprint_results(season: int):
     try:
-        schedule = fastf1.get_event_schedule(season)
-        sprint_rounds = schedule[schedule["EventFormat"] == "sprint"]
+        events = [(e["round"], e["name"]) for e in schedule_service.get(season).weekends(sprint_only=True)]
         all_sprints = []
-        for _, row in sprint_rounds.iterrows():
-            round_number = int(row["RoundNumber"])
-            print(f"Sprint round: {round_number} - {row['EventName']}")
-            found = False
-            for sprint_code in ["S", "Sprint"]:
-                try:
-                    print(f"  Deneniyor: get_session({season}, {round_number}, '{sprint_code}')")
-                    session = fastf1.get_session(season, round_number, sprint_code)
-                    session.load()
-                    results = session.results
-                    if results is not None:
-                        sprint_results = []
-                        for idx, r in results.iterrows():
-                            pos = int(r["Position"])
-                            if pos <= 8:
-                                sprint_results.append({
-                                    "position": pos,
-                                    "driver": r["FullName"],
-                                    "abbreviation": r["Abbreviation"],
-                                    "team": r["TeamName"]
-                                })
-                        all_sprints.append({
-                            "round": round_number,
-                            "event": row["EventName"],
-                            "sprint_code": sprint_code,
-                            "sprint_results": sprint_results
-                        })
-                        found = True
-                        break
-                except Exception as e:
-                    print(f"  Hata: {e}")
-                    continue
-            if not found:
-                all_sprints.append({
+        for (round_number, event_name), (sprint, error) in zip(events, fan_out(lambda e: _load_sprint(season, *e), events)):
+            if error is not None or sprint is None:
+                mark_partial()
+                sprint = {
                     "round": round_number,
-                    "event": row["EventName"],
+                    "event": event_name,
                     "error": "Sprint oturumu bulunamadı veya veri yok."
-                })
+                }
+            all_sprints.append(sprint)
         return {"season": season, "sprints": all_sprints}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-def scrape_f1_sprint_results(season):
-    url = f"https://www.formula1.com/en/results.html/{season}/races.html"
-    options = Options()
-    options.add_argument("--headless")
-    driver = webdriver.Chrome(options=options)
+# Arka plan ön yükleme zamanlayıcısı: etkinlik takviminden yeni tamamlanan
+# hafta sonlarının oturumlarını (Q, R, varsa S) yükler, yarış sonucu payload'ını ve
+# pist haritasını hazırlar, ardından sezon puan durumunu yeniden hesaplar.
+# PREFETCH_SEASONS ile verilen sezonlar açılışta baştan sona ısıtılır. İşler yalnızca
+# kendi iş parçacıklarında (PREFETCH_WORKERS) çalışır, ortak havuzlara iş göndermez;
+# puan durumu turları da sırayla hesaplanır. Canlı istek varken her işten ve her
+# turdan önce beklenir; her işten sonra harcanan CPU süresi PREFETCH_CPU_BUDGET
+# oranını aşmayacak kadar uyunur. Pist haritası için gereken telemetri oturumu
+# oturum LRU'suna konmaz, yalnızca koordinatlar saklanır.
+PREFETCH_ENABLED = os.environ.get("PREFETCH_ENABLED", "0") == "1"
+PREFETCH_SEASONS = [int(s) for s in os.environ.get("PREFETCH_SEASONS", "").split(",") if s.strip()]
+PREFETCH_INTERVAL = float(os.environ.get("PREFETCH_INTERVAL", "900"))
+PREFETCH_WORKERS = int(os.environ.get("PREFETCH_WORKERS", "1"))
+PREFETCH_CPU_BUDGET = float(os.environ.get("PREFETCH_CPU_BUDGET", "0.25"))
+PREFETCH_BACKOFF = 1.0
+PREFETCH_TRACK_MAP_SIZE = (640, 480)
+PREFETCH_JOBS = Counter("f1api_prefetch_jobs_total", "Ön yükleme işleri.", ("kind", "result"))
+
+class PrefetchScheduler:
+    def __init__(self, seasons, interval, workers, cpu_budget):
+        self.seasons = seasons
+        self.interval = interval
+        self.workers = workers
+        self.cpu_budget = cpu_budget
+        self._queue = deque()
+        self._queued = set()
+        self._done = set()
+        self._running = {}
+        self._failed = deque(maxlen=20)
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._threads = []
+        self.completed = 0
+        self.throttled = 0
+        self.last_poll = None
+        self.poll_errors = {}
+
+    def start(self, poll=False):
+        with self._cond:
+            if self._threads:
+                return
+            self._stop.clear()
+            for i in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f"prefetch-{i}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            if poll:
+                thread = threading.Thread(target=self._poll_loop, name="prefetch-poll", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self):
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+        for thread in threads:
+            thread.join(timeout=5)
+
+    def enqueue(self, job):
+        with self._cond:
+            if job in self._queued or job in self._done or job in self._running.values():
+                return False
+            self._queue.append(job)
+            self._queued.add(job)
+            self._cond.notify()
+            return True
+
+    def plan_season(self, season, now=None):
+        # Tamamlanmış her hafta sonu için eksik işler kuyruğa eklenir
+        schedule = schedule_service.get(season)
+        completed = set(schedule.completed_rounds(now))
+        queued = 0
+        for event in schedule.weekends():
+            if event["round"] not in completed:
+                continue
+            codes = ("Q", "R", "S") if has_sprint(event) else ("Q", "R")
+            for code in codes:
+                queued += self.enqueue(("session", season, event["round"], code))
+            queued += self.enqueue(("track_map", season, event["round"], None))
+        if queued:
+            # Puan durumu her yeni turdan sonra yeniden hesaplanmalı
+            with self._cond:
+                self._done.discard(("standings", season, None, None))
+            queued += self.enqueue(("standings", season, None, None))
+        return queued
+
+    def poll(self):
+        seasons = list(dict.fromkeys(self.seasons + [pd.Timestamp.now().year]))
+        for season in seasons:
+            try:
+                self.plan_season(season)
+                self.poll_errors.pop(season, None)
+            except Exception as e:
+                self.poll_errors[season] = str(e)
+        self.last_poll = time.time()
+
+    def _poll_loop(self):
+        while not self._stop.is_set():
+            self.poll()
+            self._stop.wait(self.interval)
+
+    def _next(self):
+        with self._cond:
+            while not self._queue and not self._stop.is_set():
+                self._cond.wait()
+            if self._stop.is_set():
+                return None
+            job = self._queue.popleft()
+            self._queued.discard(job)
+            self._running[threading.get_ident()] = job
+            return job
+
+    def _work(self):
+        while True:
+            job = self._next()
+            if job is None:
+                return
+            cpu_start = time.thread_time()
+            try:
+                self._wait_for_idle()
+                self._run(job)
+                result = "ok"
+                with self._cond:
+                    self._done.add(job)
+                    self.completed += 1
+            except Exception as e:
+                # Başarısız iş bir sonraki yoklamada yeniden denenir
+                result = "error"
+                self._failed.append({"job": list(job), "error": str(e), "at": time.time()})
+            finally:
+                with self._cond:
+                    self._running.pop(threading.get_ident(), None)
+            PREFETCH_JOBS.inc(job[0], result)
+            cpu = time.thread_time() - cpu_start
+            if 0 < self.cpu_budget < 1:
+                self._stop.wait(cpu * (1 / self.cpu_budget - 1))
+
+    def _wait_for_idle(self):
+        # Canlı istekler sürerken ön yükleme bekler
+        while load_executor.pending > 0 and not self._stop.is_set():
+            self.throttled += 1
+            self._stop.wait(PREFETCH_BACKOFF)
+        if self._stop.is_set():
+            raise RuntimeError("Ön yükleme durduruldu")
+
+    def _run(self, job):
+        kind, season, round, code = job
+        with span("prefetch"):
+            if kind == "session":
+                load_session(season, round, code)
+                if code == "R":
+                    race_results_payload(season, round)
+            elif kind == "track_map":
+                width, height = PREFETCH_TRACK_MAP_SIZE
+                key = ("map", season, round, f"{width}x{height}.png")
+                if track_map_cache.get(key) is None:
+                    coords = _track_coordinates(season, round, load_detached_session)
+                    if coords is not None and len(coords):
+                        track_map_cache.put(key, _render_track_png(coords, width, height))
+            elif kind == "standings":
+                standings_engine.warm(season, self._wait_for_idle)
+
+    def stats(self):
+        with self._cond:
+            return {
+                "running": bool(self._threads),
+                "seasons": self.seasons,
+                "interval": self.interval,
+                "workers": self.workers,
+                "cpu_budget": self.cpu_budget,
+                "queue": [list(job) for job in self._queue],
+                "in_progress": [list(job) for job in self._running.values()],
+                "completed": self.completed,
+                "throttled": self.throttled,
+                "done": len(self._done),
+                "failed": list(self._failed),
+                "last_poll": self.last_poll,
+                "poll_errors": self.poll_errors
+            }
+
+prefetch_scheduler = PrefetchScheduler(PREFETCH_SEASONS, PREFETCH_INTERVAL, PREFETCH_WORKERS, PREFETCH_CPU_BUDGET)
+
+@app.get("/admin/prefetch")
+async def get_prefetch_status():
+    return prefetch_scheduler.stats()
+
+# formula1.com kazıma altyapısı: yeniden kullanılan tarayıcı havuzu, sabit
+# beklemeler yerine açık bekleme koşulları, zaman aşımlı kalıcı bir HTTP oturumu
+# ve TTL + koşullu GET (ETag/Last-Modified) ile ayrıştırılmış sonuç önbelleği.
+# F1_WEB_BASE_URL yerel bir test sunucusuna çevrilerek çevrimdışı denenebilir
+# (benchmarks/scrape_offline.py, kaydedilmiş sayfalar benchmarks/fixtures altında).
+F1_WEB_BASE_URL = os.environ.get("F1_WEB_BASE_URL", "https://www.formula1.com").rstrip("/")
+SCRAPE_HTTP_TIMEOUT = float(os.environ.get("SCRAPE_HTTP_TIMEOUT", "15"))
+SCRAPE_WAIT_TIMEOUT = float(os.environ.get("SCRAPE_WAIT_TIMEOUT", "15"))
+SCRAPE_CACHE_TTL = float(os.environ.get("SCRAPE_CACHE_TTL", "3600"))
+SCRAPE_BROWSERS = int(os.environ.get("SCRAPE_BROWSERS", str(scrape_executor.workers)))
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+def http_session():
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_maxsize=max(SCRAPE_BROWSERS, 4), max_retries=2)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _http_session = session
+    return _http_session
+
+class ScrapeCache:
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry["fetched_at"] < self.ttl:
+                self.hits += 1
+                return entry["value"]
+        return None
+
+    def put(self, key, value, etag=None, last_modified=None):
+        with self._lock:
+            self._entries[key] = {
+                "value": value,
+                "etag": etag,
+                "last_modified": last_modified,
+                "fetched_at": time.monotonic()
+            }
+
+    def fetch(self, url, parse):
+        value = self.get(url)
+        if value is not None:
+            return value
+        with self._lock:
+            entry = self._entries.get(url)
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        with span("scrape"):
+            response = http_session().get(url, headers=headers, timeout=SCRAPE_HTTP_TIMEOUT)
+        if response.status_code == 304 and entry is not None:
+            # Sayfa değişmemiş; önceki ayrıştırma sonucu yeniden kullanılır
+            with self._lock:
+                entry["fetched_at"] = time.monotonic()
+                self.revalidated += 1
+            return entry["value"]
+        response.raise_for_status()
+        value = parse(response.text)
+        with self._lock:
+            self.misses += 1
+        self.put(url, value, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses
+            }
+
+scrape_cache = ScrapeCache(SCRAPE_CACHE_TTL)
+
+class BrowserPool:
+    def __init__(self, size):
+        self.size = size
+        self._idle = []
+        self._created = 0
+        self._cond = threading.Condition()
+
+    def _new_browser(self):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        options = Options()
+        options.add_argument("--headless")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        return webdriver.Chrome(options=options)
+
+    def _acquire(self):
+        with self._cond:
+            while not self._idle and self._created >= self.size:
+                if not self._cond.wait(timeout=SCRAPE_WAIT_TIMEOUT):
+                    raise TimeoutError("Boşta tarayıcı bulunamadı.")
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+        try:
+            return self._new_browser()
+        except BaseException:
+            with self._cond:
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def browser(self):
+        driver = self._acquire()
+        try:
+            yield driver
+        except BaseException:
+            # Hata veren tarayıcı havuza geri konmaz
+            self._discard(driver)
+            raise
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+        for driver in idle:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+    def stats(self):
+        with self._cond:
+            return {"size": self.size, "created": self._created, "idle": len(self._idle)}
+
+browser_pool = BrowserPool(SCRAPE_BROWSERS)
+
+class ScrapeError(Exception):
+    pass
+
+def _scrape_sprint_table(driver, url):
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.common.exceptions import TimeoutException
     driver.get(url)
-    time.sleep(3)  # Sayfanın yüklenmesini bekle
+    wait = WebDriverWait(driver, SCRAPE_WAIT_TIMEOUT)
 
     # Sprint sekmesini bul ve tıkla
     try:
-        sprint_tab = driver.find_element(By.XPATH, "//a[contains(text(), 'Sprint')]")
+        old_tables = driver.find_elements(By.CSS_SELECTOR, "table.resultsarchive-table")
+        sprint_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[contains(text(), 'Sprint')]")))
         sprint_tab.click()
-        time.sleep(2)
-    except Exception as e:
-        driver.quit()
-        return {"error": "Sprint sekmesi bulunamadı veya tıklanamadı."}
+        if old_tables:
+            # Sprint tablosu yüklenene kadar eski tablonun sayfadan kalkması beklenir
+            try:
+                WebDriverWait(driver, SCRAPE_WAIT_TIMEOUT / 3).until(EC.staleness_of(old_tables[0]))
+            except TimeoutException:
+                pass
+    except Exception:
+        raise ScrapeError("Sprint sekmesi bulunamadı veya tıklanamadı.")
 
-    # Tabloyu bul ve verileri çek
-    results = []
+    # Tablo yüklenince sayfa bir kez alınıp ayrıştırılır (hücre başına WebDriver çağrısı yapılmaz)
     try:
-        rows = driver.find_elements(By.CSS_SELECTOR, "table.resultsarchive-table tbody tr")
-        for row in rows:
-            cols = row.find_elements(By.TAG_NAME, "td")
-            if len(cols) > 0:
-                results.append({
-                    "position": cols[1].text,
-                    "driver": cols[3].text,
-                    "team": cols[4].text,
-                    "time": cols[6].text,
-                    "points": cols[7].text
-                })
-    except Exception as e:
-        driver.quit()
-        return {"error": "Sprint sonuçları çekilemedi."}
+        wait.until(EC.presence_of_all_elements_located(
+            (By.CSS_SELECTOR, "table.resultsarchive-table tbody tr")
+        ))
+        return _parse_sprint_table(driver.page_source)
+    except Exception:
+        raise ScrapeError("Sprint sonuçları çekilemedi.")
+
+def _parse_sprint_table(html):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "lxml")
 
-    driver.quit()
+    results = []
+    for row in soup.select("table.resultsarchive-table tbody tr"):
+        cols = [td.get_text(" ", strip=True) for td in row.find_all("td")]
+        if len(cols) > 7:
+            results.append({
+                "position": cols[1],
+                "driver": cols[3],
+                "team": cols[4],
+                "time": cols[6],
+                "points": cols[7]
+            })
+    return results
+
+def scrape_f1_sprint_results(season):
+    url = f"{F1_WEB_BASE_URL}/en/results.html/{season}/races.html"
+    key = ("sprints", url)
+    results = scrape_cache.get(key)
+    if results is None:
+        try:
+            with browser_pool.browser() as driver, span("scrape"):
+                results = _scrape_sprint_table(driver, url)
+        except ScrapeError as e:
+            return {"error": str(e)}
+        scrape_cache.put(key, results)
     return {"season": season, "sprint_results": results}
 
 @app.get("/scrape-sprints/{season}")
+@offload(scrape_executor)
 def scrape_sprints(season: int):
     return scrape_f1_sprint_results(season)
 
-@app.get("/sprints/2024")
-def get_2024_sprint_results():
-    season = 2024
-    all_sprints = []
-    for round_number, event_name in SPRINT_ROUNDS_2024.items():
-        try:
-            session = fastf1.get_session(season, round_number, "S")
-            session.load()
-            results = session.results
-            sprint_results = []
-            if results is not None:
-                for idx, r in results.iterrows():
-                    pos = int(r["Position"])
-                    if pos <= 8:
-                        sprint_results.append({
-                            "position": pos,
-                            "driver": r["FullName"],
-                            "abbreviation": r["Abbreviation"],
-                            "team": r["TeamName"]
-                        })
-            all_sprints.append({
-                "round": round_number,
-                "event": event_name,
-                "sprint_results": sprint_results
-            })
-        except Exception as e:
-            all_sprints.append({
-                "round": round_number,
-                "event": event_name,
-                "error": str(e)
-            })
-    return {"season": season, "sprints": all_sprints}
+def _parse_race_schedule(html):
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "lxml")
+
+    races = []
+    for event in soup.select(".event-item-wrapper"):
+        name_tag = event.select_one(".event-title .event-title-text")
+        date_tag = event.select_one(".event-date .date")
+        name = name_tag.get_text(strip=True) if name_tag else "?"
+        date = date_tag.get_text(strip=True) if date_tag else "?"
+        # Saat bilgisi genellikle 'Race' oturumu altında
+        time_tag = event.select_one(".event-session-list .session-item--race .session-time")
+        time = time_tag.get_text(strip=True) if time_tag else "Saat bilgisi yok"
+        races.append({
+            "name": name,
+            "date": date,
+            "time": time
+        })
+    return races
 
 @app.get("/scrape-race-schedule/{year}")
+@offload(scrape_executor)
 def scrape_race_schedule(year: int):
     try:
-        url = f"https://www.formula1.com/en/racing/{year}.html"
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, "lxml")
-
-        races = []
-        for event in soup.select(".event-item-wrapper"):
-            name_tag = event.select_one(".event-title .event-title-text")
-            date_tag = event.select_one(".event-date .date")
-            name = name_tag.get_text(strip=True) if name_tag else "?"
-            date = date_tag.get_text(strip=True) if date_tag else "?"
-            # Saat bilgisi genellikle 'Race' oturumu altında
-            time_tag = event.select_one(".event-session-list .session-item--race .session-time")
-            time = time_tag.get_text(strip=True) if time_tag else "Saat bilgisi yok"
-            races.append({
-                "name": name,
-                "date": date,
-                "time": time
-            })
+        url = f"{F1_WEB_BASE_URL}/en/racing/{year}.html"
+        races = scrape_cache.fetch(url, _parse_race_schedule)
         return {"year": year, "races": races}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) 
\ No newline at end of file